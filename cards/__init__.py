@@ -1,4 +1,22 @@
 """
 Cards module containing credit card configurations for different banks.
 """
-# pylint: disable=duplicate-code
+
+from cards.alrajhi import get_alrajhi_card
+from cards.bsf import get_lifestyle_card
+from cards.nayfat import get_nayfat_card
+from cards.nbd import get_nbd_card
+from cards.sabb import get_sabb_card
+from cards.saib import get_saib_card
+from cards.snb import get_snb_card
+
+# Every supported card factory, in the order the cards are shown in the UI.
+ALL_FACTORIES = (
+    get_snb_card,
+    get_alrajhi_card,
+    get_nbd_card,
+    get_lifestyle_card,
+    get_saib_card,
+    get_sabb_card,
+    get_nayfat_card,
+)
@@ -2,9 +2,12 @@
 This module provides the configuration for the Alrajhi Bank.
 """
 
+from functools import lru_cache
+
 from models import CardCategory, CreditCard, categories
 
 
+@lru_cache(maxsize=1)
 def get_alrajhi_card() -> CreditCard:
     """Return Alrajhi Platinum Cashback Plus credit card configuration."""
     return CreditCard(
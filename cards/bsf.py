@@ -1,6 +1,7 @@
 """
 This module provides the configuration for the BSF Bank"""
 
+from functools import lru_cache
 from itertools import combinations
 
 from models import CardCategory, LifestyleCard, LifestylePlan, categories
@@ -13,6 +14,18 @@ lifestyle_base_categories = [
     categories["education"],
 ]
 
+# Every plan shares these three rate/cap combinations.
+_MAIN_RATE_CAP = CardCategory(rate=0.10, cap=250)
+_MAJOR_RATE_CAP = CardCategory(rate=0.03, cap=250)
+_MINOR_RATE_CAP = CardCategory(rate=0.02, cap=250)
+
+# Index pairs splitting four categories into (major, minor) pairs.
+_MAJOR_MINOR_SPLITS = tuple(
+    (major, tuple(k for k in range(4) if k not in major))
+    for major in combinations(range(4), 2)
+)
+
+
 def generate_plans(list_of_categories: list) -> list:
     """
     Generates all possible plans from a list of categories.
@@ -40,24 +53,20 @@ def generate_plans(list_of_categories: list) -> list:
     #    This ensures every group of 5 is considered exactly once.
     for group_of_five in combinations(list_of_categories, 5):
         # 2. Within this group of 5, iterate through each to select it as the main category.
-        for main_category in group_of_five:
+        for main_idx in range(5):
             # 3. The remaining 4 categories are candidates for major and minor roles.
-            remaining_four = list(group_of_five)
-            remaining_four.remove(main_category)
-
-            # 4. From the remaining 4, choose 2 to be the major categories.
-            for major_categories in combinations(remaining_four, 2):
-                # 5. The final 2 categories automatically become the minor ones.
-                #    We can find them using set difference for efficiency.
-                minor_categories = tuple(set(remaining_four) - set(major_categories))
-
-                # Create the plan dictionary and add it to our list.
-                plan = {
-                    "main": main_category,
-                    "major": list(major_categories),
-                    "minor": list(minor_categories),
-                }
-                all_plans.append(plan)
+            remaining_four = group_of_five[:main_idx] + group_of_five[main_idx + 1 :]
+
+            # 4. Pick 2 of the remaining 4 as major categories; the other 2
+            #    become the minor ones, kept in their original order.
+            for (i, j), (k, m) in _MAJOR_MINOR_SPLITS:
+                all_plans.append(
+                    {
+                        "main": group_of_five[main_idx],
+                        "major": [remaining_four[i], remaining_four[j]],
+                        "minor": [remaining_four[k], remaining_four[m]],
+                    }
+                )
 
     return all_plans
 
@@ -80,12 +89,8 @@ def generate_life_style_plans() -> list[LifestylePlan]:
         minor_categories = plan["minor"]
 
         # Create a more descriptive name
-        major_cat_names = (
-            f"{major_categories[0].display_name}, {major_categories[1].display_name}"
-        )
-        minor_cat_names = (
-            f"{minor_categories[0].display_name}, {minor_categories[1].display_name}"
-        )
+        major_cat_names = ", ".join(cat.display_name for cat in major_categories)
+        minor_cat_names = ", ".join(cat.display_name for cat in minor_categories)
         plan_name = (
             f"10% on {main_category.display_name}; "
             f"3% on {major_cat_names}; "
@@ -96,9 +101,9 @@ def generate_life_style_plans() -> list[LifestylePlan]:
             LifestylePlan(
                 name=plan_name,
                 categories_rate_cap=[
-                    {main_category: CardCategory(rate=0.10, cap=250)},
-                    {cat: CardCategory(rate=0.03, cap=250) for cat in major_categories},
-                    {cat: CardCategory(rate=0.02, cap=250) for cat in minor_categories},
+                    {main_category: _MAIN_RATE_CAP},
+                    {cat: _MAJOR_RATE_CAP for cat in major_categories},
+                    {cat: _MINOR_RATE_CAP for cat in minor_categories},
                 ],
             )
         )
@@ -106,10 +111,13 @@ def generate_life_style_plans() -> list[LifestylePlan]:
     return lifestyle_plans
 
 
+# The plans only depend on the static base categories, so build them once.
+_LIFESTYLE_PLANS = generate_life_style_plans()
+
+
+@lru_cache(maxsize=1)
 def get_lifestyle_card() -> LifestyleCard:
     """Return BSF Lifestyle credit card configuration."""
-    lifestyle_plans = generate_life_style_plans()
-
     return LifestyleCard(
         name="BSF Lifestyle",
         reference_link=(
@@ -118,7 +126,7 @@ def get_lifestyle_card() -> LifestyleCard:
         ),
         base_rate=0.005,
         annual_fee=0, # the fee if it is waived
-        plans=lifestyle_plans,
+        plans=_LIFESTYLE_PLANS,
         annual_fee_if_condition_not_met=287.5,  # Annual fee if not waived
         # The condition to waive the annual fee
         minimum_annual_spend_for_fee_waiver=20000
@@ -3,9 +3,12 @@ This module provides the configuration for the SNB Bank.
 """
 # pylint: disable=duplicate-code
 
+from functools import lru_cache
+
 from models import CardCategory, CreditCard, categories
 
 
+@lru_cache(maxsize=1)
 def get_nayfat_card() -> CreditCard:
     """Return Nayfat Platinum Cashback credit card configuration.
 
@@ -5,9 +5,12 @@ This module provides the configuration for the NBD Bank.
     ""
 )
 
+from functools import lru_cache
+
 from models import CardCategory, CreditCard, categories
 
 
+@lru_cache(maxsize=1)
 def get_nbd_card() -> CreditCard:
     """Return NBD Cashback credit card configuration."""
     return CreditCard(
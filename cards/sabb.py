@@ -2,57 +2,42 @@
 This module provides the configuration for the SAIB Bank."""
 # pylint: disable=duplicate-code
 
+from functools import lru_cache
+
 from models import CashbackTier, CreditCard, TierCategory, categories
 
+# Monthly cashback cap per bonus category; identical in every tier.
+_CATEGORY_CAPS = {
+    categories["grocery"]: 100,
+    categories["dining"]: 200,
+    categories["gas_station"]: 100,
+}
+
+# (name, min_spend, max_spend, bonus category rate)
+_TIERS = (
+    ("Tier 1 (0K-2K)", 0, 1999, 0.0),
+    ("Tier 2 (2K-10K)", 2000, 9999, 0.03),
+    ("Tier 3 (10K-15K)", 10000, 14999, 0.05),
+    ("Tier 4 (15K+)", 15000, float("inf"), 0.1),
+)
+
 
+@lru_cache(maxsize=1)
 def get_sabb_card() -> CreditCard:
     """Return SABB Cashback credit card configuration with detailed tiers."""
 
     sabb_tiers = [
         CashbackTier(
-            name="Tier 1 (0K-2K)",
-            min_spend=0,
-            max_spend=1999,
-            base_rate=0.001,
-            categories={
-                categories["grocery"]: TierCategory(rate=0.0, cap=100),
-                categories["dining"]: TierCategory(rate=0.0, cap=200),
-                categories["gas_station"]: TierCategory(rate=0.0, cap=100),
-            },
-        ),
-        CashbackTier(
-            name="Tier 2 (2K-10K)",
-            min_spend=2000,
-            max_spend=9999,
+            name=name,
+            min_spend=min_spend,
+            max_spend=max_spend,
             base_rate=0.001,
             categories={
-                categories["grocery"]: TierCategory(rate=0.03, cap=100),
-                categories["dining"]: TierCategory(rate=0.03, cap=200),
-                categories["gas_station"]: TierCategory(rate=0.03, cap=100),
+                cat: TierCategory(rate=rate, cap=cap)
+                for cat, cap in _CATEGORY_CAPS.items()
             },
-        ),
-        CashbackTier(
-            name="Tier 3 (10K-15K)",
-            min_spend=10000,
-            max_spend=14999,
-            base_rate=0.001,
-            categories={
-                categories["grocery"]: TierCategory(rate=0.05, cap=100),
-                categories["dining"]: TierCategory(rate=0.05, cap=200),
-                categories["gas_station"]: TierCategory(rate=0.05, cap=100),
-            },
-        ),
-        CashbackTier(
-            name="Tier 4 (15K+)",
-            min_spend=15000,
-            max_spend=float("inf"),
-            base_rate=0.001,
-            categories={
-                categories["grocery"]: TierCategory(rate=0.1, cap=100),
-                categories["dining"]: TierCategory(rate=0.1, cap=200),
-                categories["gas_station"]: TierCategory(rate=0.1, cap=100),
-            },
-        ),
+        )
+        for name, min_spend, max_spend, rate in _TIERS
     ]
 
     return CreditCard(
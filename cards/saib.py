@@ -2,56 +2,47 @@
 This module provides the configuration for the SAIB Bank."""
 # pylint: disable=duplicate-code
 
+from functools import lru_cache
+
 from models import CashbackTier, CreditCard, TierCategory, categories
 
+# Monthly cashback cap per bonus category; identical in every tier.
+_CATEGORY_CAPS = {
+    categories["grocery"]: 100,
+    categories["education"]: 200,
+    categories["dining"]: 200,
+    categories["gas_station"]: 100,
+}
+
+# (name, min_spend, max_spend, base rate, bonus category rate or None)
+_TIERS = (
+    ("Tier 1 (0K-3K)", 0, 2999, 0.0, None),
+    ("Tier 2 (3K-10K)", 3000, 9999, 0.005, 0.03),
+    ("Tier 3 (10K-15K)", 10000, 14999, 0.005, 0.05),
+    ("Tier 4 (15K+)", 15000, float("inf"), 0.005, 0.1),
+)
+
 
+@lru_cache(maxsize=1)
 def get_saib_card() -> CreditCard:
     """Return SAIB Cashback credit card configuration with detailed tiers."""
 
     saib_tiers = [
         CashbackTier(
-            name="Tier 1 (0K-3K)",
-            min_spend=0,
-            max_spend=2999,
-            base_rate=0.0,
-            categories={},
-        ),
-        CashbackTier(
-            name="Tier 2 (3K-10K)",
-            min_spend=3000,
-            max_spend=9999,
-            base_rate=0.005,
-            categories={
-                categories["grocery"]: TierCategory(rate=0.03, cap=100),
-                categories["education"]: TierCategory(rate=0.03, cap=200),
-                categories["dining"]: TierCategory(rate=0.03, cap=200),
-                categories["gas_station"]: TierCategory(rate=0.03, cap=100),
-            },
-        ),
-        CashbackTier(
-            name="Tier 3 (10K-15K)",
-            min_spend=10000,
-            max_spend=14999,
-            base_rate=0.005,
-            categories={
-                categories["grocery"]: TierCategory(rate=0.05, cap=100),
-                categories["education"]: TierCategory(rate=0.05, cap=200),
-                categories["dining"]: TierCategory(rate=0.05, cap=200),
-                categories["gas_station"]: TierCategory(rate=0.05, cap=100),
-            },
-        ),
-        CashbackTier(
-            name="Tier 4 (15K+)",
-            min_spend=15000,
-            max_spend=float("inf"),
-            base_rate=0.005,
-            categories={
-                categories["grocery"]: TierCategory(rate=0.1, cap=100),
-                categories["education"]: TierCategory(rate=0.1, cap=200),
-                categories["dining"]: TierCategory(rate=0.1, cap=200),
-                categories["gas_station"]: TierCategory(rate=0.1, cap=100),
-            },
-        ),
+            name=name,
+            min_spend=min_spend,
+            max_spend=max_spend,
+            base_rate=base_rate,
+            categories=(
+                {}
+                if rate is None
+                else {
+                    cat: TierCategory(rate=rate, cap=cap)
+                    for cat, cap in _CATEGORY_CAPS.items()
+                }
+            ),
+        )
+        for name, min_spend, max_spend, base_rate, rate in _TIERS
     ]
 
     return CreditCard(
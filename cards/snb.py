@@ -3,9 +3,12 @@ This module provides the configuration for the SNB Bank.
 """
 # pylint: disable=duplicate-code
 
+from functools import lru_cache
+
 from models import CardCategory, CreditCard, categories
 
 
+@lru_cache(maxsize=1)
 def get_snb_card() -> CreditCard:
     """Return SNB Premium Cashback credit card configuration.
 
@@ -7,24 +7,44 @@ calls the optimization logic to find the best credit card combination.
 
 import streamlit as st
 
-from cards.alrajhi import get_alrajhi_card
-from cards.bsf import get_lifestyle_card
-from cards.nayfat import get_nayfat_card
-from cards.nbd import get_nbd_card
-from cards.sabb import get_sabb_card
-from cards.saib import get_saib_card
-from cards.snb import get_snb_card
+from cards import ALL_FACTORIES
+from models import CreditCard
 from optimizer import solve_optimization
 from translations import TRANSLATIONS
 from ui import display_results, setup_sidebar
 
+# --- FINAL CSS FIX ---
+# This selector is highly specific to override Streamlit's defaults.
+# It targets the text span inside the multiselect component in the sidebar.
+_BASE_CSS = """<style>
+    div[data-testid="stSidebar"] div[data-baseweb="select"]
+    div[role="listbox"] div[data-baseweb="tag"] > span {
+        font-size: 6px !important;
+    }
+
+    /* --- Language Specific Styles --- */
+    .stRadio[role=radiogroup]{
+        flex-direction: row-reverse;
+    }
+    div[data-testid="stSlider"] > div[data-baseweb="slider"] > div {
+        direction: ltr;
+    }
+    </style>"""
+_RTL_CSS = "<style>body { direction: rtl; }</style>"
+
+
+def _load_cards() -> dict[str, CreditCard]:
+    """Return every configured card keyed by name.
+
+    The factories memoize their cards, so this only rebuilds the name map.
+    """
+    return {card.name: card for card in (factory() for factory in ALL_FACTORIES)}
+
 
 def main():
     """Main function to run the Streamlit application."""
     st.set_page_config(layout="wide", page_title="Credit Card Optimizer 💳")
 
-
-
     if "lang" not in st.session_state:
         st.session_state.lang = "en"
 
@@ -37,46 +57,18 @@ def main():
     st.session_state.lang = "ar" if lang_choice == "العربية" else "en"
     t = TRANSLATIONS[st.session_state.lang]
 
-    # --- FINAL CSS FIX ---
-    # This selector is highly specific to override Streamlit's defaults.
-    # It targets the text span inside the multiselect component in the sidebar.
-    st.markdown(
-        """<style>
-    div[data-testid="stSidebar"] div[data-baseweb="select"]
-    div[role="listbox"] div[data-baseweb="tag"] > span {
-        font-size: 6px !important;
-    }
-
-    /* --- Language Specific Styles --- */
-    .stRadio[role=radiogroup]{
-        flex-direction: row-reverse;
-    }
-    div[data-testid="stSlider"] > div[data-baseweb="slider"] > div {
-        direction: ltr;
-    }
-    </style>""",
-        unsafe_allow_html=True,
-    )
-
+    # Streamlit drops elements that a rerun does not emit again, so the styles
+    # are re-sent every run; only the strings are built once.
+    st.markdown(_BASE_CSS, unsafe_allow_html=True)
     if st.session_state.lang == "ar":
-        st.markdown(
-            "<style>body { direction: rtl; }</style>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_RTL_CSS, unsafe_allow_html=True)
 
     st.title(t["title"])
     st.markdown(t["description"])
     st.markdown("---")
 
-    all_cards = [
-        get_snb_card(),
-        get_alrajhi_card(),
-        get_nbd_card(),
-        get_lifestyle_card(),
-        get_saib_card(),
-        get_sabb_card(),
-        get_nayfat_card()
-    ]
+    cards_by_name = _load_cards()
+    all_cards = list(cards_by_name.values())
     currency_symbol = t["currency_symbol"]
 
     monthly_spending, optimize_button, selected_card_names = setup_sidebar(
@@ -88,11 +80,19 @@ def main():
             st.warning(t["warning_no_spend"])
         else:
             with st.spinner(t["spinner_text"]):
-                selected_cards = [
-                    card for card in all_cards if card.name in selected_card_names
-                ]
+                if len(selected_card_names) == len(all_cards):
+                    selected_cards = all_cards
+                else:
+                    selected_cards = [
+                        cards_by_name[name]
+                        for name in selected_card_names
+                        if name in cards_by_name
+                    ]
+                # Streamlit reruns this script on every widget change; the
+                # optimizer caches results per cards and spending, so repeated
+                # inputs skip the solve.
                 optimization_result = solve_optimization(
-                    selected_cards, {k: float(v) for k, v in monthly_spending.items()}
+                    selected_cards, monthly_spending
                 )
             if optimization_result is None:
                 st.error(t["error_no_solution"])
@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence
 
 import pandas as pd
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Category:
     """Represents a single category with its internal key and display name."""
 
@@ -13,7 +14,37 @@ class Category:
     parent_key: str | None = None
 
 
-@dataclass
+def _read_only(mapping: Mapping) -> Mapping:
+    """Return a read-only copy of ``mapping``.
+
+    The card models are frozen and their instances are shared by every
+    caller, so their mapping fields are stored through this. The views are
+    not hashable, so those fields are declared with ``hash=False``; equality
+    still compares them.
+    """
+    return MappingProxyType(dict(mapping))
+
+
+def _category_vectors(
+    category_map: Mapping[Category, "CardCategory | TierCategory"], base_rate: float
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Return (rates, caps) for every known category, in ``categories`` order.
+
+    Categories missing from ``category_map`` fall back to ``base_rate`` with
+    no cap. CashbackTier and CreditCard store the result as their derived
+    ``category_rates`` and ``category_caps`` fields, so the effective rate
+    and cap of any category is a positional lookup.
+    """
+    rates = []
+    caps = []
+    for cat in categories.values():
+        rate_cap = category_map.get(cat)
+        rates.append(rate_cap.rate if rate_cap else base_rate)
+        caps.append(rate_cap.cap if rate_cap else float("inf"))
+    return tuple(rates), tuple(caps)
+
+
+@dataclass(frozen=True, slots=True)
 class CardCategory:
     """Represents a single cashback category on a card for non-tiered cards."""
 
@@ -21,7 +52,7 @@ class CardCategory:
     cap: float = float("inf")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TierCategory:
     """Represents the cashback details for a category within a specific tier."""
 
@@ -29,18 +60,26 @@ class TierCategory:
     cap: float = float("inf")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CashbackTier:
     """Represents a cashback tier based on total monthly spend."""
 
     name: str
     min_spend: float
     max_spend: float
-    categories: Dict[Category, TierCategory]
+    categories: Mapping[Category, TierCategory] = field(hash=False)
     base_rate: float  # A base rate for categories not explicitly listed in the tier
+    category_rates: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    category_caps: tuple[float, ...] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        object.__setattr__(self, "categories", _read_only(self.categories))
+        rates, caps = _category_vectors(self.categories, self.base_rate)
+        object.__setattr__(self, "category_rates", rates)
+        object.__setattr__(self, "category_caps", caps)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CreditCard:  # pylint: disable=too-many-instance-attributes
     """Represents a standard credit card."""
 
@@ -52,54 +91,113 @@ class CreditCard:  # pylint: disable=too-many-instance-attributes
     min_spend_for_cashback: float = 0.0  # New attribute for minimum spend
     minimum_annual_spend_for_fee_waiver: Optional[float] = None
     annual_fee_if_condition_not_met: Optional[float] = None
-    grouped_monthly_caps: List[tuple[float, List[Category]]] = field(
-        default_factory=list
+    grouped_monthly_caps: Sequence[tuple[float, Sequence[Category]]] = ()
+    categories: Mapping[Category, CardCategory] = field(
+        default_factory=dict, hash=False
     )
-    categories: Dict[Category, CardCategory] = field(default_factory=dict)
     base_rate: float = 0.0
-    tiers: List[CashbackTier] = field(default_factory=list)
-
+    tiers: Sequence[CashbackTier] = ()
+    category_rates: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    category_caps: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    # (category, rate, cap) for the categories whose cap is finite.
+    finite_caps: tuple[tuple[Category, float, float], ...] = field(
+        init=False, repr=False, compare=False
+    )
 
-@dataclass
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "grouped_monthly_caps",
+            tuple((cap, tuple(cats)) for cap, cats in self.grouped_monthly_caps),
+        )
+        object.__setattr__(self, "categories", _read_only(self.categories))
+        object.__setattr__(self, "tiers", tuple(self.tiers))
+        rates, caps = _category_vectors(self.categories, self.base_rate)
+        object.__setattr__(self, "category_rates", rates)
+        object.__setattr__(self, "category_caps", caps)
+        object.__setattr__(
+            self,
+            "finite_caps",
+            tuple(
+                (cat, card_cat.rate, card_cat.cap)
+                for cat, card_cat in self.categories.items()
+                if card_cat.cap != float("inf")
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class LifestylePlan:
     """Represents one of the selectable monthly plans for the Lifestyle card."""
 
     name: str
-    categories_rate_cap: List[dict[Category, CardCategory]]
-
-
-@dataclass
+    categories_rate_cap: Sequence[Mapping[Category, CardCategory]] = field(
+        hash=False
+    )
+    # Flat category -> rate view of ``categories_rate_cap``. Caps stay
+    # per group because each group shares a single cap.
+    rates: Mapping[Category, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "categories_rate_cap",
+            tuple(_read_only(group) for group in self.categories_rate_cap),
+        )
+        object.__setattr__(
+            self,
+            "rates",
+            MappingProxyType(
+                {
+                    cat: card_cat.rate
+                    for group in self.categories_rate_cap
+                    for cat, card_cat in group.items()
+                }
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class LifestyleCard(CreditCard):
     """Represents the special Lifestyle card with selectable plans."""
 
-    plans: List[LifestylePlan] = field(default_factory=list)
+    plans: Sequence[LifestylePlan] = ()
 
+    def __post_init__(self):
+        CreditCard.__post_init__(self)
+        object.__setattr__(self, "plans", tuple(self.plans))
 
-@dataclass
+
+@dataclass(slots=True)
 class OptimizationResult:
     """Holds the results of the optimization."""
 
     results_df: pd.DataFrame
     total_savings: float
     chosen_plan: str
-
-
-categories = {
-    "dining": Category(key="Dining", display_name="Dining"),
-    "grocery": Category(key="Grocery", display_name="Grocery"),
-    "gas_station": Category(key="Gas Station", display_name="Gas Station"),
-    "pharmacy": Category(key="Pharmacy", display_name="Pharmacy"),
-    "travel_hotels": Category(key="Travel & Hotels", display_name="Travel & Hotels"),
-    "education": Category(key="Education", display_name="Education"),
-    "medical_care": Category(key="Medical Care", display_name="Medical Care"),
-    "online_shopping_local": Category(
-        key="Online Shopping (Local)", display_name="Online Shopping (Local)"
-    ),
-    "international_spend": Category(
-        key="International Spend",
-        display_name="International Spend",
-    ),
-    "other_local_spend": Category(
-        key="Other Local Spend", display_name="Other Local Spend"
-    ),
-}
\ No newline at end of file
+    # Solver value of every model variable, keyed by name; used as a warm start.
+    variable_values: Dict[str, float] = field(default_factory=dict, repr=False)
+
+
+# Read-only view: the categories are shared by every card module.
+categories = MappingProxyType(
+    {
+        "dining": Category(key="Dining", display_name="Dining"),
+        "grocery": Category(key="Grocery", display_name="Grocery"),
+        "gas_station": Category(key="Gas Station", display_name="Gas Station"),
+        "pharmacy": Category(key="Pharmacy", display_name="Pharmacy"),
+        "travel_hotels": Category(key="Travel & Hotels", display_name="Travel & Hotels"),
+        "education": Category(key="Education", display_name="Education"),
+        "medical_care": Category(key="Medical Care", display_name="Medical Care"),
+        "online_shopping_local": Category(
+            key="Online Shopping (Local)", display_name="Online Shopping (Local)"
+        ),
+        "international_spend": Category(
+            key="International Spend",
+            display_name="International Spend",
+        ),
+        "other_local_spend": Category(
+            key="Other Local Spend", display_name="Other Local Spend"
+        ),
+    }
+)
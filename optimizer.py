@@ -1,12 +1,26 @@
+import dataclasses
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 import pandas as pd
 from pulp import (
     LpAffineExpression,
     LpBinary,
-    LpMaximize,
+    LpConstraint,
+    LpConstraintEQ,
+    LpConstraintLE,
+    LpMinimize,
     LpProblem,
+    LpSolutionIntegerFeasible,
+    LpSolutionOptimal,
+    LpSolver,
     LpVariable,
+    getSolver,
+    listSolvers,
     lpSum,
 )  # type: ignore
 
@@ -15,37 +29,164 @@ from models import (
     CreditCard,
     LifestyleCard,
     OptimizationResult,
-    TierCategory,
     categories,
 )
 
-LARGE_NUMBER = 1_000_000  # A large number for big-M method in LP
 ALL_CATEGORIES = tuple(categories.values())
+# Position of each category in ALL_CATEGORIES and the cards' rate vectors.
+_CATEGORY_INDEX = {cat: i for i, cat in enumerate(ALL_CATEGORIES)}
+MIP_REL_GAP = 1e-3  # Stop once the incumbent is within 0.1% of the best bound
+SOLVER_TIME_LIMIT = 10  # Seconds before returning the best solution found
+# PuLP solver names, fastest first. The bundled CBC is always available.
+# "HiGHS" runs in-process through highspy, skipping the LP-file round trip
+# of the *_CMD backends. Its PuLP wrapper takes no MIP start, though, so
+# with highspy installed every solve starts cold: the faster backend is
+# traded for the warm start, which HiGHS_CMD, GUROBI and CBC still use.
+SOLVER_PREFERENCE = ("HiGHS", "HiGHS_CMD", "GUROBI", "GUROBI_CMD", "PULP_CBC_CMD")
+# Backends whose PuLP wrapper does not accept a MIP start.
+_NO_WARM_START = frozenset({"HiGHS"})
+SOLUTION_CACHE_SIZE = 256  # Distinct problems whose results are kept
+# Streamlit runs each session in its own thread, so every read and write of
+# the caches below holds this lock. Solves run outside it.
+_cache_lock = threading.Lock()
+_solution_cache: "OrderedDict[str, OptimizationResult | None]" = OrderedDict()
+# Latest solved variable values per card configuration, used as a MIP start.
+_last_solution: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+
+
+@lru_cache(maxsize=1)
+def _preferred_solver_name() -> str:
+    """Return the first solver in SOLVER_PREFERENCE installed on this machine."""
+
+    available = set(listSolvers(onlyAvailable=True))
+    return next(
+        (name for name in SOLVER_PREFERENCE if name in available), "PULP_CBC_CMD"
+    )
+
+
+def _default_solver(
+    warm_start: bool = False,
+    gap_rel: float = MIP_REL_GAP,
+    time_limit: float = SOLVER_TIME_LIMIT,
+) -> LpSolver:
+    """Return the preferred available solver with the gap and time limits."""
+
+    name = _preferred_solver_name()
+    options = {
+        "msg": False,
+        "timeLimit": time_limit,
+        "gapRel": gap_rel,
+        "threads": os.cpu_count(),
+    }
+    if name not in _NO_WARM_START:
+        options["warmStart"] = warm_start
+    return getSolver(name, **options)
+
+
+def _spend_terms(weighted_spend):
+    """Yield the (spend variable, weight) pairs whose variable exists.
+
+    Spend variables only exist for categories with spending, so a card's
+    spend row holds ``None`` for the others and every expression over a row
+    goes through this filter.
+    """
+
+    return ((var, weight) for var, weight in weighted_spend if var is not None)
+
+
+def _at_most(terms, rhs: float, name: str | None = None) -> LpConstraint:
+    """Return the row ``sum(coefficient * variable) <= rhs`` built in one pass.
+
+    Writing ``spend * rate <= cap * y`` allocates an expression per product
+    and another for the difference; building the row from its terms is
+    several times faster.
+    """
+
+    return LpConstraint(LpAffineExpression(terms), LpConstraintLE, name, rhs)
 
 
-def _rate_for_category(card: CreditCard, category: Category) -> float:
-    """Return the cashback rate for a card/category combination."""
+def _equal_to(terms, rhs: float, name: str | None = None) -> LpConstraint:
+    """Return the row ``sum(coefficient * variable) == rhs`` built in one pass."""
 
-    card_category = card.categories.get(category)
-    return card_category.rate if card_category else card.base_rate
+    return LpConstraint(LpAffineExpression(terms), LpConstraintEQ, name, rhs)
 
 
-def _card_cashback_value(card: CreditCard, spend_vars: Dict) -> LpAffineExpression:
+def _min_spend_row(total_spend, min_spend: float, switch) -> LpConstraint:
+    """Return the row ``total_spend >= min_spend * switch``.
+
+    Spend is never negative, so ``min_spend`` itself is a valid big-M: the
+    row holds trivially while ``switch`` is 0.
+    """
+
+    return total_spend >= min_spend * switch
+
+
+def _bound_by_switch(prob, var, value, big_m: float, switch) -> None:
+    """Bound ``var`` by ``value`` while ``switch`` is 1 and by 0 otherwise.
+
+    ``big_m`` must be an upper bound on ``value``. ``var`` only adds to the
+    cashback the objective maximises, so it settles at the smaller bound and
+    needs no lower-bound row.
+    """
+
+    prob += var <= big_m * switch
+    prob += var <= value
+
+
+def _card_cashback_value(card: CreditCard, spend_row) -> LpAffineExpression:
     """Return the expression for total cashback at the category-specific rates."""
 
-    return lpSum(
-        spend_vars[card.name, cat.key] * _rate_for_category(card, cat)
-        for cat in ALL_CATEGORIES
+    return LpAffineExpression(_spend_terms(zip(spend_row, card.category_rates)))
+
+
+def _card_total_spend(spend_row) -> LpAffineExpression:
+    """Return the expression for the card's spend across all categories."""
+
+    return LpAffineExpression((var, 1) for var in spend_row if var is not None)
+
+
+def _max_cashback(rates, caps, monthly_spending: Dict[str, float]) -> float:
+    """Return the most cashback the given rates and caps can pay on the spending.
+
+    Used as the big-M for rows that switch a cashback term on or off: a
+    bound derived from the actual spending keeps the LP relaxation tight.
+    """
+
+    return sum(
+        min(cap, monthly_spending.get(cat.key, 0) * rate)
+        for cat, rate, cap in zip(ALL_CATEGORIES, rates, caps)
     )
 
 
+def _max_card_cashback(card: CreditCard, monthly_spending: Dict[str, float]) -> float:
+    """Return an upper bound on the monthly cashback of a non-tiered ``card``.
+
+    Only the min-spend gate of non-tiered cards uses this bound; tiered
+    cards are gated by their tier choice instead.
+    """
+
+    bound = _max_cashback(card.category_rates, card.category_caps, monthly_spending)
+    if isinstance(card, LifestyleCard):
+        return bound
+    return min(bound, card.monthly_cap)
+
+
 def _create_variables(
     cards: List[CreditCard],
+    lifestyle_card: LifestyleCard | None,
+    monthly_spending: Dict[str, float],
 ) -> Tuple[Dict, Dict, Dict, Dict]:
-    """Creates the decision variables for the optimization problem."""
+    """Creates the decision variables for the optimization problem.
+
+    Spend variables are only created for categories with spending; the
+    others would be fixed at zero anyway.
+    """
+    spent_categories = [
+        cat for cat in ALL_CATEGORIES if monthly_spending.get(cat.key, 0)
+    ]
     spend_vars = LpVariable.dicts(
         "Spend",
-        ((c.name, cat.key) for c in cards for cat in ALL_CATEGORIES),
+        ((c.name, cat.key) for c in cards for cat in spent_categories),
         lowBound=0,
     )
 
@@ -53,7 +194,6 @@ def _create_variables(
         "CardActive", (c.name for c in cards), cat=LpBinary
     )
 
-    lifestyle_card = next((c for c in cards if isinstance(c, LifestyleCard)), None)
     plan_vars = {}
     activated_bonus_vars = {}
     if lifestyle_card:
@@ -68,131 +208,161 @@ def _create_variables(
 
 
 def _add_tiered_cashback_logic(
-    prob, card, total_spend_on_card, spend_vars, card_active_var
+    prob, card, total_spend_on_card, spend_row, cashback_switch, monthly_spending
 ):
-    """Adds the logic for tiered cashback cards to the problem."""
+    """Adds the logic for tiered cashback cards to the problem.
+
+    Exactly one tier is chosen when ``cashback_switch`` is 1 and none when it
+    is 0, so only the chosen tier pays. Every big-M is the tightest bound the
+    spending allows. Rows that cannot bind for this spending are left out.
+    """
+    total_monthly_spend = sum(monthly_spending.values())
     components = []
     tier_vars = LpVariable.dicts(
         f"TierChoice_{card.name}", (t.name for t in card.tiers), cat=LpBinary
     )
     prob += (
-        lpSum(tier_vars.values()) == card_active_var,
+        LpAffineExpression((v, 1) for v in tier_vars.values()) == cashback_switch,
         f"ChooseTierIfActive_{card.name}",
     )
 
     for tier in card.tiers:
         y = tier_vars[tier.name]
-        prob += total_spend_on_card >= tier.min_spend - LARGE_NUMBER * (1 - y)
-        if tier.max_spend != float("inf"):
-            prob += total_spend_on_card <= tier.max_spend + LARGE_NUMBER * (1 - y)
-
-        # Apply category caps - these must be enforced on the raw cashback amounts
-        for cat in categories.values():
-            tier_cat = tier.categories.get(
-                cat, TierCategory(rate=tier.base_rate, cap=float("inf"))
-            )
-            if tier_cat.cap != float("inf"):
-                cashback = spend_vars[card.name, cat.key] * tier_cat.rate
-                prob += cashback <= tier_cat.cap * y
-        
+        if tier.min_spend > 0:
+            prob += _min_spend_row(total_spend_on_card, tier.min_spend, y)
+        if tier.max_spend < total_monthly_spend:
+            prob += total_spend_on_card <= tier.max_spend + (
+                total_monthly_spend - tier.max_spend
+            ) * (1 - y)
+
+        # Apply category caps - these must be enforced on the raw cashback amounts.
+        # A cap only holds while its tier is chosen; the big-M is how far the
+        # category's spending could overshoot it, so caps that can never bind
+        # for this spending get no row.
+        for cat, spend, rate, cap in zip(
+            ALL_CATEGORIES, spend_row, tier.category_rates, tier.category_caps
+        ):
+            if spend is None:
+                continue
+            cap_big_m = monthly_spending[cat.key] * rate - cap
+            if cap_big_m > 0:
+                # spend * rate <= cap + M * (1 - y)
+                prob += _at_most(((spend, rate), (y, cap_big_m)), cap + cap_big_m)
+
         # Compute total cashback for this tier as a single expression
-        tier_cashback_expr = lpSum(
-            spend_vars[card.name, cat.key]
-            * tier.categories.get(
-                cat, TierCategory(rate=tier.base_rate, cap=float("inf"))
-            ).rate
-            for cat in categories.values()
+        tier_cashback_expr = LpAffineExpression(
+            _spend_terms(zip(spend_row, tier.category_rates))
         )
-        
+
         # Create one activated cashback variable for the entire tier
         activated_cashback = LpVariable(
             f"ActivatedCashback_{card.name}_{tier.name}", lowBound=0
         )
-        prob += activated_cashback <= LARGE_NUMBER * y
-        prob += activated_cashback <= tier_cashback_expr
+        big_m = _max_cashback(
+            tier.category_rates, tier.category_caps, monthly_spending
+        )
+        _bound_by_switch(prob, activated_cashback, tier_cashback_expr, big_m, y)
         components.append(activated_cashback)
     return components
 
 
-def _gate_cashback_by_min_spend(
-    prob,
-    card,
-    total_spend_on_card,
-    card_active_var,
-    cashback_components,
+def _add_min_spend_switch(
+    prob, card, total_spend_on_card, card_active_var, monthly_spending
 ):
-    """Wrap cashback components so they only pay out when the spend minimum is met."""
+    """Return a binary that is 1 exactly when the card's spend minimum is met."""
 
     cashback_active = LpVariable(f"CashbackActive_{card.name}", cat=LpBinary)
     prob += cashback_active <= card_active_var
 
     min_spend = card.min_spend_for_cashback
-    prob += total_spend_on_card >= min_spend - LARGE_NUMBER * (1 - cashback_active)
-    prob += (
-        total_spend_on_card
-        <= (min_spend - 0.01)
-        + LARGE_NUMBER * (cashback_active + (1 - card_active_var))
-    )
+    prob += _min_spend_row(total_spend_on_card, min_spend, cashback_active)
+    # Forcing cashback on above the minimum only matters when it is reachable.
+    spend_big_m = sum(monthly_spending.values()) - (min_spend - 0.01)
+    if spend_big_m > 0:
+        prob += (
+            total_spend_on_card
+            <= (min_spend - 0.01)
+            + spend_big_m * (cashback_active + (1 - card_active_var))
+        )
+    return cashback_active
+
+
+def _gate_cashback_by_min_spend(
+    prob, card, cashback_active, cashback_components, monthly_spending
+):
+    """Wrap cashback components so they only pay out when ``cashback_active`` is 1."""
+
+    cashback_big_m = _max_card_cashback(card, monthly_spending)
 
     gated_components = []
     for index, component in enumerate(cashback_components):
         activated_cashback = LpVariable(
             f"ActivatedCashback_{card.name}_{index}", lowBound=0
         )
-        prob += activated_cashback <= LARGE_NUMBER * cashback_active
-        prob += activated_cashback <= component
-        prob += activated_cashback >= component - LARGE_NUMBER * (1 - cashback_active)
+        _bound_by_switch(
+            prob, activated_cashback, component, cashback_big_m, cashback_active
+        )
         gated_components.append(activated_cashback)
 
     return gated_components
 
 
-def _add_regular_cashback_logic(card, spend_vars):
-    """Adds the logic for regular (non-tiered, non-min-spend) cards."""
-    components = [
-        lpSum(
-            spend_vars[card.name, cat.key] * card.base_rate for cat in ALL_CATEGORIES
-        )
-    ]
-    if not isinstance(card, LifestyleCard):
-        for cat, card_cat in card.categories.items():
-            bonus = spend_vars[card.name, cat.key] * (card_cat.rate - card.base_rate)
-            components.append(bonus)
-    return components
+def _add_regular_cashback_logic(card, spend_row):
+    """Adds the logic for regular (non-tiered, non-min-spend) cards.
+
+    Returns a single expression at the category-specific rates. Lifestyle
+    cards only earn their base rate here; plan bonuses are linked separately.
+    """
+    if isinstance(card, LifestyleCard):
+        return [
+            LpAffineExpression(
+                (var, card.base_rate) for var in spend_row if var is not None
+            )
+        ]
+    return [_card_cashback_value(card, spend_row)]
 
 
-def _add_total_spend_constraints(prob, cards, monthly_spending, spend_vars):
+def _add_total_spend_constraints(prob, cards, monthly_spending, spend_rows):
     """Ensure per-category spend matches the provided monthly_spending totals.
     Balance total spend per category to match the provided monthly amounts.
 
     Each constraint enforces that the sum of spending across all cards equals the
     requested monthly spending for that category (defaulting to 0 when the
     caller omits a category). This differentiates the spend balancing logic
-    from the cashback cap constraints defined elsewhere.
+    from the cashback cap constraints defined elsewhere. Categories with no
+    spending have no spend variables and need no row.
     """
-    for cat in ALL_CATEGORIES:
-        prob += (
-            lpSum(spend_vars[c.name, cat.key] for c in cards)
-            == monthly_spending.get(cat.key, 0),
+    for index, cat in enumerate(ALL_CATEGORIES):
+        if not monthly_spending.get(cat.key, 0):
+            continue
+        prob += _equal_to(
+            ((spend_rows[c.name][index], 1) for c in cards),
+            monthly_spending.get(cat.key, 0),
             f"Spend_Total_{cat.key}",
         )
 
 
 def _add_card_constraints(
-    prob, card, total_monthly_spend, spend_vars, card_active_var
+    prob,
+    card,
+    total_monthly_spend,
+    spend_row,
+    total_spend_on_card,
+    card_active_var,
+    card_cashback,
 ):
     """Add per-card spend limit and cashback cap constraints.
 
     The TotalSpendLimit ensures all spending is gated by ``card_active_var``.
-    Monthly caps, category caps, and grouped caps are expressed in cashback
-    units and are also multiplied by ``card_active_var`` so they only apply when
-    the card is active.
+    Monthly caps and grouped caps are expressed in cashback units and are
+    also multiplied by ``card_active_var`` so they only apply when the card
+    is active. Category caps become upper bounds on the spend variables.
+    ``total_spend_on_card`` and ``card_cashback`` are the expressions already
+    built for the objective (``card_cashback`` is ``None`` for tiered cards).
     """
-    total_spend_on_card = lpSum(
-        spend_vars[card.name, cat.key] for cat in ALL_CATEGORIES
-    )
-    prob += (
-        total_spend_on_card <= total_monthly_spend * card_active_var,
+    prob += _at_most(
+        [*total_spend_on_card.items(), (card_active_var, -total_monthly_spend)],
+        0,
         f"TotalSpendLimit_{card.name}",
     )
 
@@ -203,36 +373,38 @@ def _add_card_constraints(
             not isinstance(card, LifestyleCard)
             and card.monthly_cap != float("inf")
         ):
-            cashback = _card_cashback_value(card, spend_vars)
-            prob += (
-                cashback <= card.monthly_cap * card_active_var,
+            prob += _at_most(
+                [*card_cashback.items(), (card_active_var, -card.monthly_cap)],
+                0,
                 f"MonthlyCap_{card.name}",
             )
 
-        for cat, card_cat in card.categories.items():
-            if card_cat.cap != float("inf"):
-                prob += (
-                    spend_vars[card.name, cat.key] * card_cat.rate
-                    <= card_cat.cap * card_active_var,
-                    f"CatCap_{card.name}_{cat.key}",
-                )
+        # Spend is already gated by the TotalSpendLimit above, so a category
+        # cap is just an upper bound on its spend variable, not a row.
+        for cat, rate, cap in card.finite_caps:
+            spend = spend_row[_CATEGORY_INDEX[cat]]
+            if spend is not None and rate > 0:
+                bound = cap / rate
+                if spend.upBound is None or bound < spend.upBound:
+                    spend.upBound = bound
 
         for i, (cap, cat_list) in enumerate(card.grouped_monthly_caps):
-            prob += (
-                lpSum(
-                    spend_vars[card.name, c.key] * _rate_for_category(card, c)
-                    for c in cat_list
+            group_terms = list(
+                _spend_terms(
+                    (spend_row[index], card.category_rates[index])
+                    for index in (_CATEGORY_INDEX[c] for c in cat_list)
                 )
-                <= cap * card_active_var,
-                f"GroupCap_{card.name}_{i}",
             )
+            if group_terms:
+                group_terms.append((card_active_var, -cap))
+                prob += _at_most(group_terms, 0, f"GroupCap_{card.name}_{i}")
 
 
 def _add_lifestyle_plan_constraints(
-    prob, lifestyle_card, plan_vars, spend_vars, card_active_var
+    prob, lifestyle_card, plan_vars, spend_row, card_active_var, monthly_spending
 ):
     prob += (
-        lpSum(plan_vars.values()) == card_active_var,
+        LpAffineExpression((v, 1) for v in plan_vars.values()) == card_active_var,
         "Select_One_Lifestyle_Plan",
     )
     for plan in lifestyle_card.plans:
@@ -247,23 +419,43 @@ def _add_lifestyle_plan_constraints(
                     f"Plan '{plan.name}', group {i}, caps found: {caps}, categories: {category_keys}"
                 )
             cap = caps.pop()
-            if cap != float("inf"):
-                cashback = lpSum(
-                    spend_vars[lifestyle_card.name, cat.key] * cat_rate.rate
+            # The group can never earn more than its whole spend at the plan
+            # rate, so that bound minus the cap is the tightest valid big-M.
+            # When it is not positive the cap cannot bind and the row is skipped.
+            big_m = (
+                sum(
+                    monthly_spending.get(cat.key, 0) * cat_rate.rate
                     for cat, cat_rate in group.items()
                 )
+                - cap
+            )
+            if big_m > 0:
+                cashback = LpAffineExpression(
+                    _spend_terms(
+                        (spend_row[_CATEGORY_INDEX[cat]], cat_rate.rate)
+                        for cat, cat_rate in group.items()
+                    )
+                )
                 prob += (
-                    cashback <= cap + LARGE_NUMBER * (1 - plan_var),
+                    cashback <= cap + big_m * (1 - plan_var),
                     f"PlanCap_{plan.name}_{i}",
                 )
 
 
 def _add_constraints(
-    prob, cards, monthly_spending, spend_vars, plan_vars, card_active_vars
+    prob,
+    cards,
+    monthly_spending,
+    spend_rows,
+    total_spend_by_card,
+    plan_vars,
+    card_active_vars,
+    card_cashback,
+    lifestyle_card,
 ):
     """Adds all constraints to the optimization problem."""
 
-    _add_total_spend_constraints(prob, cards, monthly_spending, spend_vars)
+    _add_total_spend_constraints(prob, cards, monthly_spending, spend_rows)
 
     total_monthly_spend = sum(monthly_spending.values())
     for card in cards:
@@ -271,57 +463,84 @@ def _add_constraints(
             prob,
             card,
             total_monthly_spend,
-            spend_vars,
+            spend_rows[card.name],
+            total_spend_by_card[card.name],
             card_active_vars[card.name],
+            card_cashback.get(card.name),
         )
 
-    lifestyle_card = next((c for c in cards if isinstance(c, LifestyleCard)), None)
     if lifestyle_card:
         _add_lifestyle_plan_constraints(
             prob,
             lifestyle_card,
             plan_vars,
-            spend_vars,
+            spend_rows[lifestyle_card.name],
             card_active_vars[lifestyle_card.name],
+            monthly_spending,
         )
 
 
 def _build_optimization_problem(
     cards: List[CreditCard], monthly_spending: Dict[str, float]
-) -> Tuple[LpProblem, Dict, Dict]:
+) -> Tuple[LpProblem, Dict, Dict, Dict]:
     """Builds and returns the PuLP optimization problem."""
-    prob = LpProblem("Unified_Card_Optimizer", LpMaximize)
+    prob = LpProblem("Unified_Card_Optimizer", LpMinimize)
+    lifestyle_card = next((c for c in cards if isinstance(c, LifestyleCard)), None)
     spend_vars, plan_vars, activated_bonus_vars, card_active_vars = _create_variables(
-        cards
+        cards, lifestyle_card, monthly_spending
     )
+    # Each card's spend variables in ALL_CATEGORIES order (None when the
+    # category has no spending), so expressions zip a row with the rate
+    # vectors instead of hashing (card, category) keys term by term.
+    spend_rows = {
+        card.name: tuple(
+            spend_vars.get((card.name, cat.key)) for cat in ALL_CATEGORIES
+        )
+        for card in cards
+    }
+    # Shared by the tier logic, min-spend gate, spend limit and fee waiver.
+    total_spend_by_card = {
+        card.name: _card_total_spend(spend_rows[card.name]) for card in cards
+    }
 
     # --- Objective Function ---
     all_cashback = []
+    card_cashback: Dict[str, LpAffineExpression] = {}
     for card in cards:
-        total_spend = lpSum(
-            spend_vars[card.name, cat.key] for cat in ALL_CATEGORIES
-        )
+        total_spend = total_spend_by_card[card.name]
+        cashback_switch = card_active_vars[card.name]
+        if card.min_spend_for_cashback > 0:
+            cashback_switch = _add_min_spend_switch(
+                prob, card, total_spend, cashback_switch, monthly_spending
+            )
         cashback_components: List[LpAffineExpression] = []
         if card.tiers:
+            # The tier choice already switches the cashback on and off, so
+            # the spend minimum gates it directly rather than through proxies.
             cashback_components = _add_tiered_cashback_logic(
-                prob, card, total_spend, spend_vars, card_active_vars[card.name]
-            )
-        else:
-            cashback_components = _add_regular_cashback_logic(card, spend_vars)
-
-        if card.min_spend_for_cashback > 0:
-            cashback_components = _gate_cashback_by_min_spend(
                 prob,
                 card,
                 total_spend,
-                card_active_vars[card.name],
-                cashback_components,
+                spend_rows[card.name],
+                cashback_switch,
+                monthly_spending,
             )
+        else:
+            cashback_components = _add_regular_cashback_logic(
+                card, spend_rows[card.name]
+            )
+            card_cashback[card.name] = cashback_components[0]
+            if card.min_spend_for_cashback > 0:
+                cashback_components = _gate_cashback_by_min_spend(
+                    prob, card, cashback_switch, cashback_components, monthly_spending
+                )
 
         all_cashback.extend(cashback_components)
 
     # Add lifestyle bonus to objective
-    all_cashback.append(lpSum(activated_bonus_vars.values()))
+    all_cashback.append(
+        LpAffineExpression((v, 1) for v in activated_bonus_vars.values())
+    )
 
     # Calculate total annual fees with new conditional logic
     total_annual_fees = []
@@ -332,24 +551,22 @@ def _build_optimization_problem(
         ):
             fee_is_waived = LpVariable(f"FeeWaived_{card.name}", cat=LpBinary)
             prob += fee_is_waived <= card_active_vars[card.name]
-            annual_spend_on_card = lpSum(
-                spend_vars[card.name, cat.key] for cat in categories.values()
-            ) * 12
+            annual_spend_on_card = total_spend_by_card[card.name] * 12
+            waiver_spend = card.minimum_annual_spend_for_fee_waiver
+            # A waiver implies an active card, and an inactive card has no
+            # spend, so neither row needs a (1 - active) relaxation term.
+            # The most the card can see is 12x the total monthly spend.
             prob += (
-                annual_spend_on_card
-                >= card.minimum_annual_spend_for_fee_waiver
-                - LARGE_NUMBER
-                * (1 - fee_is_waived + (1 - card_active_vars[card.name])),
+                annual_spend_on_card >= waiver_spend * fee_is_waived,
                 f"Waived_Spend_Constraint_1_{card.name}",
             )
-            prob += (
-                annual_spend_on_card
-                <= card.minimum_annual_spend_for_fee_waiver
-                - 0.01
-                + LARGE_NUMBER
-                * (fee_is_waived + (1 - card_active_vars[card.name])),
-                f"Waived_Spend_Constraint_2_{card.name}",
-            )
+            waiver_big_m = 12 * sum(monthly_spending.values()) - (waiver_spend - 0.01)
+            if waiver_big_m > 0:
+                prob += (
+                    annual_spend_on_card
+                    <= waiver_spend - 0.01 + waiver_big_m * fee_is_waived,
+                    f"Waived_Spend_Constraint_2_{card.name}",
+                )
             annual_fee_to_pay = (
                 card.annual_fee_if_condition_not_met * card_active_vars[card.name]
                 - (
@@ -361,62 +578,142 @@ def _build_optimization_problem(
         else:
             total_annual_fees.append(card.annual_fee * card_active_vars[card.name])
 
-    # Final objective function: Net Annual Savings
+    # Final objective function: Net Annual Savings, negated and minimised.
+    # CBC misprices a MIP start under -max and can return the start itself
+    # as "optimal"; as a minimisation the start is a valid cutoff.
     total_monthly_cashback = lpSum(all_cashback)
     prob += (
-        (total_monthly_cashback * 12) - lpSum(total_annual_fees),
+        lpSum(total_annual_fees) - total_monthly_cashback * 12,
         "Total_Net_Annual_Savings",
     )
 
     # --- Constraints ---
     _add_constraints(
-        prob, cards, monthly_spending, spend_vars, plan_vars, card_active_vars
+        prob,
+        cards,
+        monthly_spending,
+        spend_rows,
+        total_spend_by_card,
+        plan_vars,
+        card_active_vars,
+        card_cashback,
+        lifestyle_card,
     )
 
     # Link lifestyle bonus to objective
-    lifestyle_card = next((c for c in cards if isinstance(c, LifestyleCard)), None)
     if lifestyle_card:
+        lifestyle_row = spend_rows[lifestyle_card.name]
         for plan in lifestyle_card.plans:
-            potential_bonus = lpSum(
-                spend_vars[lifestyle_card.name, cat.key]
-                * (card_cat.rate - lifestyle_card.base_rate)
-                for group in plan.categories_rate_cap
-                for cat, card_cat in group.items()
+            potential_bonus = LpAffineExpression(
+                _spend_terms(
+                    (
+                        lifestyle_row[_CATEGORY_INDEX[cat]],
+                        rate - lifestyle_card.base_rate,
+                    )
+                    for cat, rate in plan.rates.items()
+                )
             )
-            prob += (
-                activated_bonus_vars[plan.name] <= LARGE_NUMBER * plan_vars[plan.name]
+            # Upper bound on the bonus: all category spend on this card.
+            big_m = max(
+                0.0,
+                sum(
+                    monthly_spending.get(cat.key, 0)
+                    * (rate - lifestyle_card.base_rate)
+                    for cat, rate in plan.rates.items()
+                ),
+            )
+            _bound_by_switch(
+                prob,
+                activated_bonus_vars[plan.name],
+                potential_bonus,
+                big_m,
+                plan_vars[plan.name],
             )
-            prob += activated_bonus_vars[plan.name] <= potential_bonus
-            prob += activated_bonus_vars[
-                plan.name
-            ] >= potential_bonus - LARGE_NUMBER * (1 - plan_vars[plan.name])
 
-    return prob, spend_vars, plan_vars
+    return prob, spend_vars, plan_vars, card_active_vars
+
+
+def _greedy_spend_allocation(
+    cards: List[CreditCard], monthly_spending: Dict[str, float]
+) -> Dict[Tuple[str, str], float] | None:
+    """Place each category's spend on the best-rate cards that still have room.
+
+    Only cards without tiers, spend minimums or plans take part, and every
+    category, grouped and monthly cap is respected, so the allocation is a
+    feasible MIP start. Returns ``None`` when some spend cannot be placed.
+    """
+    simple_cards = [
+        c
+        for c in cards
+        if not c.tiers
+        and not isinstance(c, LifestyleCard)
+        and c.min_spend_for_cashback <= 0
+    ]
+    monthly_room = {c.name: c.monthly_cap for c in simple_cards}
+    group_room = {}
+    groups_by_category: Dict[Tuple[str, Category], List[Tuple[str, int]]] = {}
+    for c in simple_cards:
+        for i, (cap, cat_list) in enumerate(c.grouped_monthly_caps):
+            group_room[c.name, i] = cap
+            for cat in cat_list:
+                groups_by_category.setdefault((c.name, cat), []).append((c.name, i))
+
+    allocation = {}
+    for index, cat in enumerate(ALL_CATEGORIES):
+        remaining = monthly_spending.get(cat.key, 0)
+        if not remaining:
+            continue
+        for card in sorted(simple_cards, key=lambda c: -c.category_rates[index]):
+            rate = card.category_rates[index]
+            groups = groups_by_category.get((card.name, cat), [])
+            amount = remaining
+            if rate > 0:
+                cashback_room = min(
+                    card.category_caps[index],
+                    monthly_room[card.name],
+                    *(group_room[g] for g in groups),
+                )
+                amount = min(amount, cashback_room / rate)
+            if amount <= 0:
+                continue
+            allocation[card.name, cat.key] = amount
+            monthly_room[card.name] -= amount * rate
+            for group in groups:
+                group_room[group] -= amount * rate
+            remaining -= amount
+            if remaining <= 0:
+                break
+        else:
+            return None
+    return allocation
 
 
 def _process_optimization_results(
     prob: LpProblem,
-    cards: List[CreditCard],
     spend_vars: Dict,
     plan_vars: Dict,
 ) -> OptimizationResult | None:
     """Processes the solved PuLP problem and returns the results."""
-    results = [
-        {
-            "Card": c.name,
-            "Category": cat.key,
-            "Amount": spend_vars[c.name, cat.key].varValue,
-        }
-        for c in cards
-        for cat in categories.values()
-        if spend_vars[c.name, cat.key].varValue is not None
-        and spend_vars[c.name, cat.key].varValue > 0.01
-    ]
+    # Read every solver value once; the lookups below are plain dict hits.
+    values = {var.name: var.varValue for var in prob.variables()}
+
+    card_col, category_col, amount_col = [], [], []
+    for (card_name, cat_key), var in spend_vars.items():
+        amount = values.get(var.name)
+        if amount is not None and amount > 0.01:
+            card_col.append(card_name)
+            category_col.append(cat_key)
+            amount_col.append(amount)
 
     chosen_plan_name = ""
     if plan_vars:
         chosen_plan_name = next(
-            (p_name for p_name, var in plan_vars.items() if var.varValue > 0.9), ""
+            (
+                p_name
+                for p_name, var in plan_vars.items()
+                if (values.get(var.name) or 0) > 0.9
+            ),
+            "",
         )
     if prob.objective is None:
         return None
@@ -424,20 +721,241 @@ def _process_optimization_results(
     if objective_value is None:
         return None
     return OptimizationResult(
-        results_df=pd.DataFrame(results),
-        total_savings=float(objective_value),
+        results_df=pd.DataFrame(
+            {"Card": card_col, "Category": category_col, "Amount": amount_col}
+        ),
+        total_savings=-float(objective_value),
         chosen_plan=chosen_plan_name,
+        variable_values=values,
     )
 
 
-def solve_optimization(
+def _cards_key(cards: List[CreditCard]) -> str:
+    """Return a stable hash of the full card configurations.
+
+    Cards are hashed by their repr rather than their names, so two cards
+    that share a name but differ in rates or caps never share a result.
+    """
+
+    return hashlib.blake2b(repr(tuple(cards)).encode(), digest_size=16).hexdigest()
+
+
+def _problem_key(
+    cards_key: str, monthly_spending: Dict[str, float], *solver_limits: float
+) -> str:
+    """Return a stable hash of a card configuration, the spending and limits."""
+
+    spending = sorted((key, float(value)) for key, value in monthly_spending.items())
+    return hashlib.blake2b(
+        repr((cards_key, spending, solver_limits)).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _remember(cache: OrderedDict, key: str, value) -> None:
+    """Store ``value`` as the newest entry, evicting the oldest past the limit."""
+
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > SOLUTION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _copy_result(result: OptimizationResult | None) -> OptimizationResult | None:
+    """Return a copy of a cached result that callers may modify freely."""
+
+    if result is None:
+        return None
+    return dataclasses.replace(
+        result,
+        results_df=result.results_df.copy(),
+        variable_values=dict(result.variable_values),
+    )
+
+
+def _try_analytical_shortcut(
     cards: List[CreditCard], monthly_spending: Dict[str, float]
 ) -> OptimizationResult | None:
-    """Top-level function to solve the credit card optimization problem."""
-    prob, spend_vars, plan_vars = _build_optimization_problem(cards, monthly_spending)
-    prob.solve()
+    """Return the optimum directly when no cap, fee or condition can bind.
+
+    With only plain cards (no tiers, plans, spend minimums, grouped caps or
+    fee waivers), sending each category to a fee-free card with the highest
+    rate earns the most cashback possible. If no category or monthly cap is
+    exceeded by that allocation it is optimal and the MILP is skipped.
+    Returns ``None`` whenever the shortcut does not apply.
+    """
+    if not cards or any(
+        c.tiers
+        or isinstance(c, LifestyleCard)
+        or c.min_spend_for_cashback > 0
+        or c.grouped_monthly_caps
+        or c.minimum_annual_spend_for_fee_waiver
+        for c in cards
+    ):
+        return None
 
-    if prob.status != 1:  # 1 means "Optimal"
+    monthly_cashback = {c.name: 0.0 for c in cards}
+    card_col, category_col, amount_col = [], [], []
+    for index, cat in enumerate(ALL_CATEGORIES):
+        amount = monthly_spending.get(cat.key, 0)
+        if not amount:
+            continue
+        if amount < 0:
+            return None
+        best_rate = max(c.category_rates[index] for c in cards)
+        card = next(
+            (
+                c
+                for c in cards
+                if c.category_rates[index] == best_rate and c.annual_fee == 0
+            ),
+            None,
+        )
+        if card is None or amount * best_rate > card.category_caps[index]:
+            return None
+        monthly_cashback[card.name] += amount * best_rate
+        if amount > 0.01:
+            card_col.append(card.name)
+            category_col.append(cat.key)
+            amount_col.append(amount)
+
+    if any(monthly_cashback[c.name] > c.monthly_cap for c in cards):
         return None
+    return OptimizationResult(
+        results_df=pd.DataFrame(
+            {"Card": card_col, "Category": category_col, "Amount": amount_col}
+        ),
+        total_savings=12 * sum(monthly_cashback.values()),
+        chosen_plan="",
+    )
+
+
+def _seed_start(
+    prob: LpProblem,
+    cards: List[CreditCard],
+    monthly_spending: Dict[str, float],
+    initial_values: Dict[str, float] | None,
+    spend_vars: Dict,
+    card_active_vars: Dict,
+) -> bool:
+    """Set a MIP start from ``initial_values`` or the greedy allocation.
+
+    Returns whether any start was set.
+    """
+
+    if initial_values:
+        for var in prob.variables():
+            value = initial_values.get(var.name)
+            if value is not None:
+                var.setInitialValue(value, check=False)
+        return True
+    allocation = _greedy_spend_allocation(cards, monthly_spending)
+    if allocation is None:
+        return False
+    used_cards = {card_name for card_name, _ in allocation}
+    for spend_key, var in spend_vars.items():
+        var.setInitialValue(allocation.get(spend_key, 0))
+    for card_name, var in card_active_vars.items():
+        var.setInitialValue(1 if card_name in used_cards else 0)
+    return True
+
+
+def _solve_milp(
+    cards: List[CreditCard],
+    monthly_spending: Dict[str, float],
+    initial_values: Dict[str, float] | None,
+    solver: LpSolver | None,
+    gap_rel: float = MIP_REL_GAP,
+    time_limit: float = SOLVER_TIME_LIMIT,
+) -> OptimizationResult | None:
+    """Build and solve the MILP, warm-started from ``initial_values`` or greedily.
+
+    The start is only built when the backend accepts one (see _NO_WARM_START).
+    """
+
+    prob, spend_vars, plan_vars, card_active_vars = _build_optimization_problem(
+        cards, monthly_spending
+    )
+    backend = solver.name if solver else _preferred_solver_name()
+    warm_start = backend not in _NO_WARM_START and _seed_start(
+        prob, cards, monthly_spending, initial_values, spend_vars, card_active_vars
+    )
+    prob.solve(solver or _default_solver(warm_start, gap_rel, time_limit))
+
+    # A solve stopped by the gap or time limit still has a usable solution.
+    if prob.sol_status not in (LpSolutionOptimal, LpSolutionIntegerFeasible):
+        return None
+    return _process_optimization_results(prob, spend_vars, plan_vars)
+
+
+def clear_solution_cache() -> None:
+    """Forget every cached solution and warm start."""
+
+    with _cache_lock:
+        _solution_cache.clear()
+        _last_solution.clear()
+
+
+def solve_optimization(
+    cards: List[CreditCard],
+    monthly_spending: Dict[str, float],
+    initial_values: Dict[str, float] | None = None,
+    solver: LpSolver | None = None,
+    gap_rel: float = MIP_REL_GAP,
+    time_limit: float = SOLVER_TIME_LIMIT,
+) -> OptimizationResult | None:
+    """Top-level function to solve the credit card optimization problem.
+
+    ``initial_values`` maps variable names to a previous solution (see
+    ``OptimizationResult.variable_values``) and is handed to the solver as a
+    MIP start. Names that no longer exist in the model are ignored. Without
+    it, the last solution for the same cards is used, and failing that a
+    greedy allocation over the simple cards seeds the solver instead.
+
+    ``solver`` overrides the default backend picked from SOLVER_PREFERENCE;
+    it is used as given, so enable its ``warmStart`` to use the MIP start.
+    Otherwise the default backend stops once the incumbent is within
+    ``gap_rel`` of the best bound or after ``time_limit`` seconds, returning
+    the best solution found so far.
+
+    Selections of plain cards whose caps cannot bind are answered without
+    the solver (see ``_try_analytical_shortcut``). Results from the default
+    solver are cached per card configuration and spending (the last
+    SOLUTION_CACHE_SIZE problems), so repeating a request skips the solve
+    entirely.
+    """
+    cards_key = _cards_key(cards)
+    key = (
+        None
+        if solver
+        else _problem_key(cards_key, monthly_spending, gap_rel, time_limit)
+    )
+    with _cache_lock:
+        hit = key in _solution_cache
+        if hit:
+            _solution_cache.move_to_end(key)
+            cached = _solution_cache[key]
+    if hit:
+        return _copy_result(cached)
+
+    result = None
+    if solver is None:
+        result = _try_analytical_shortcut(cards, monthly_spending)
+    if result is None:
+        if not initial_values:
+            with _cache_lock:
+                initial_values = _last_solution.get(cards_key)
+        result = _solve_milp(
+            cards,
+            monthly_spending,
+            initial_values,
+            solver,
+            gap_rel,
+            time_limit,
+        )
+        if result is not None:
+            _remember(_last_solution, cards_key, result.variable_values)
 
-    return _process_optimization_results(prob, cards, spend_vars, plan_vars)
+    if key is not None:
+        _remember(_solution_cache, key, result)
+    return _copy_result(result)
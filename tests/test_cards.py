@@ -1,30 +1,39 @@
 """Tests for card configuration modules."""
 
-import pathlib
-import sys
-
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from models import CreditCard, LifestyleCard, categories
+from cards import ALL_FACTORIES
 from cards.snb import get_snb_card
-from cards.alrajhi import get_alrajhi_card
-from cards.nbd import get_nbd_card
 from cards.bsf import get_lifestyle_card, generate_plans, generate_life_style_plans
 from cards.sabb import get_sabb_card
 from cards.saib import get_saib_card
-from cards.nayfat import get_nayfat_card
+
+
+@pytest.mark.parametrize("factory", ALL_FACTORIES, ids=lambda f: f.__name__)
+class TestEveryCard:
+    """Checks shared by every registered card configuration."""
+
+    def test_factory_returns_credit_card(self, factory):
+        """Test that the factory returns a CreditCard instance."""
+        assert isinstance(factory(), CreditCard)
+
+    def test_card_has_name(self, factory):
+        """Test that the card has a name."""
+        assert factory().name
+
+    def test_card_has_reference_link(self, factory):
+        """Test that the card has a reference link."""
+        assert factory().reference_link
+
+    def test_card_has_annual_fee(self, factory):
+        """Test that the card's annual fee is not negative."""
+        assert factory().annual_fee >= 0
 
 
 class TestSNBCard:
     """Tests for SNB card configuration."""
 
-    def test_get_snb_card_returns_credit_card(self):
-        """Test that get_snb_card returns a CreditCard instance."""
-        card = get_snb_card()
-        assert isinstance(card, CreditCard)
-
     def test_snb_card_has_name(self):
         """Test that SNB card has a name."""
         card = get_snb_card()
@@ -33,14 +42,8 @@ class TestSNBCard:
     def test_snb_card_has_reference_link(self):
         """Test that SNB card has a reference link."""
         card = get_snb_card()
-        assert card.reference_link
         assert card.reference_link.startswith("http")
 
-    def test_snb_card_has_annual_fee(self):
-        """Test that SNB card has an annual fee."""
-        card = get_snb_card()
-        assert card.annual_fee >= 0
-
     def test_snb_card_has_base_rate(self):
         """Test that SNB card has a base rate."""
         card = get_snb_card()
@@ -52,124 +55,16 @@ class TestSNBCard:
         assert len(card.categories) > 0
 
 
-class TestAlrajhiCard:
-    """Tests for Alrajhi card configuration."""
-
-    def test_get_alrajhi_card_returns_credit_card(self):
-        """Test that get_alrajhi_card returns a CreditCard instance."""
-        card = get_alrajhi_card()
-        assert isinstance(card, CreditCard)
-
-    def test_alrajhi_card_has_name(self):
-        """Test that Alrajhi card has a name."""
-        card = get_alrajhi_card()
-        assert card.name
-
-    def test_alrajhi_card_has_reference_link(self):
-        """Test that Alrajhi card has a reference link."""
-        card = get_alrajhi_card()
-        assert card.reference_link
-
-    def test_alrajhi_card_has_annual_fee(self):
-        """Test that Alrajhi card has an annual fee."""
-        card = get_alrajhi_card()
-        assert card.annual_fee >= 0
-
-
-class TestNBDCard:
-    """Tests for NBD card configuration."""
-
-    def test_get_nbd_card_returns_credit_card(self):
-        """Test that get_nbd_card returns a CreditCard instance."""
-        card = get_nbd_card()
-        assert isinstance(card, CreditCard)
-
-    def test_nbd_card_has_name(self):
-        """Test that NBD card has a name."""
-        card = get_nbd_card()
-        assert card.name
-
-    def test_nbd_card_has_reference_link(self):
-        """Test that NBD card has a reference link."""
-        card = get_nbd_card()
-        assert card.reference_link
-
-    def test_nbd_card_has_annual_fee(self):
-        """Test that NBD card has an annual fee."""
-        card = get_nbd_card()
-        assert card.annual_fee >= 0
-
-
-class TestSABBCard:
-    """Tests for SABB card configuration."""
-
-    def test_get_sabb_card_returns_credit_card(self):
-        """Test that get_sabb_card returns a CreditCard instance."""
-        card = get_sabb_card()
-        assert isinstance(card, CreditCard)
-
-    def test_sabb_card_has_name(self):
-        """Test that SABB card has a name."""
-        card = get_sabb_card()
-        assert card.name
-
-    def test_sabb_card_has_reference_link(self):
-        """Test that SABB card has a reference link."""
-        card = get_sabb_card()
-        assert card.reference_link
-
-    def test_sabb_card_has_annual_fee(self):
-        """Test that SABB card has an annual fee."""
-        card = get_sabb_card()
-        assert card.annual_fee >= 0
-
-
-class TestSAIBCard:
-    """Tests for SAIB card configuration."""
-
-    def test_get_saib_card_returns_credit_card(self):
-        """Test that get_saib_card returns a CreditCard instance."""
-        card = get_saib_card()
-        assert isinstance(card, CreditCard)
-
-    def test_saib_card_has_name(self):
-        """Test that SAIB card has a name."""
-        card = get_saib_card()
-        assert card.name
-
-    def test_saib_card_has_reference_link(self):
-        """Test that SAIB card has a reference link."""
-        card = get_saib_card()
-        assert card.reference_link
-
-    def test_saib_card_has_annual_fee(self):
-        """Test that SAIB card has an annual fee."""
-        card = get_saib_card()
-        assert card.annual_fee >= 0
-
-
-class TestNayfatCard:
-    """Tests for Nayfat card configuration."""
-
-    def test_get_nayfat_card_returns_credit_card(self):
-        """Test that get_nayfat_card returns a CreditCard instance."""
-        card = get_nayfat_card()
-        assert isinstance(card, CreditCard)
-
-    def test_nayfat_card_has_name(self):
-        """Test that Nayfat card has a name."""
-        card = get_nayfat_card()
-        assert card.name
-
-    def test_nayfat_card_has_reference_link(self):
-        """Test that Nayfat card has a reference link."""
-        card = get_nayfat_card()
-        assert card.reference_link
-
-    def test_nayfat_card_has_annual_fee(self):
-        """Test that Nayfat card has an annual fee."""
-        card = get_nayfat_card()
-        assert card.annual_fee >= 0
+@pytest.mark.parametrize(
+    "factory", [get_sabb_card, get_saib_card], ids=lambda f: f.__name__
+)
+def test_tiers_are_contiguous(factory):
+    """Test that each tier starts right after the previous one ends."""
+    tiers = factory().tiers
+    assert tiers[0].min_spend == 0
+    for previous, current in zip(tiers, tiers[1:]):
+        assert current.min_spend == previous.max_spend + 1
+    assert tiers[-1].max_spend == float("inf")
 
 
 class TestBSFLifestyleCard:
@@ -252,6 +147,22 @@ class TestGeneratePlans:
             assert len(plan["major"]) == 2
             assert len(plan["minor"]) == 2
 
+    def test_generate_plans_enumerates_every_partition(self):
+        """Test that five categories yield 5 * C(4, 2) ordered partitions."""
+        test_categories = [
+            categories["dining"],
+            categories["grocery"],
+            categories["travel_hotels"],
+            categories["medical_care"],
+            categories["education"],
+        ]
+        plans = generate_plans(test_categories)
+        assert len(plans) == 30
+        first = plans[0]
+        assert first["main"] == categories["dining"]
+        assert first["major"] == [categories["grocery"], categories["travel_hotels"]]
+        assert first["minor"] == [categories["medical_care"], categories["education"]]
+
     def test_generate_plans_with_insufficient_categories(self):
         """Test generate_plans with fewer than 5 categories."""
         test_categories = [categories["dining"], categories["grocery"]]
@@ -304,3 +215,17 @@ class TestGenerateLifeStylePlans:
         plans = generate_life_style_plans()
         for plan in plans:
             assert len(plan.categories_rate_cap) > 0
+
+
+class TestCardFactoryCaching:
+    """Tests for the memoized card factories."""
+
+    def test_factories_return_the_same_instance(self):
+        """Test that repeated factory calls reuse the cached configuration."""
+        for factory in ALL_FACTORIES:
+            assert factory() is factory()
+
+    def test_registry_card_names_are_unique(self):
+        """Test that no two registered factories build the same card."""
+        names = [factory().name for factory in ALL_FACTORIES]
+        assert len(names) == len(set(names))
@@ -1,12 +1,9 @@
 """Tests for models.py data structures."""
 
-import pathlib
-import sys
+from collections.abc import Mapping
 
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
-
 from models import (
     CardCategory,
     CashbackTier,
@@ -20,6 +17,19 @@ from models import (
 )
 import pandas as pd
 
+_EXPECTED_CATEGORY_KEYS = (
+    "dining",
+    "grocery",
+    "gas_station",
+    "pharmacy",
+    "travel_hotels",
+    "education",
+    "medical_care",
+    "online_shopping_local",
+    "international_spend",
+    "other_local_spend",
+)
+
 
 class TestCategory:
     """Tests for Category dataclass."""
@@ -58,6 +68,12 @@ class TestCardCategory:
         assert card_cat.rate == 0.05
         assert card_cat.cap == 100
 
+    def test_card_category_is_frozen(self):
+        """Test that CardCategory is immutable so instances can be shared."""
+        card_cat = CardCategory(rate=0.05)
+        with pytest.raises(Exception):  # FrozenInstanceError
+            card_cat.rate = 0.1
+
 
 class TestTierCategory:
     """Tests for TierCategory dataclass."""
@@ -93,6 +109,21 @@ class TestCashbackTier:
         assert tier.base_rate == 0.01
         assert categories["dining"] in tier.categories
 
+    def test_cashback_tier_category_vectors(self):
+        """Test the tier's rate/cap vectors fall back to its base rate."""
+        tier = CashbackTier(
+            name="Tier 1",
+            min_spend=0,
+            max_spend=1000,
+            categories={categories["dining"]: TierCategory(rate=0.05, cap=50)},
+            base_rate=0.01,
+        )
+        keys = list(categories)
+        assert tier.category_rates[keys.index("dining")] == 0.05
+        assert tier.category_caps[keys.index("dining")] == 50
+        assert tier.category_rates[keys.index("grocery")] == 0.01
+        assert tier.category_caps[keys.index("grocery")] == float("inf")
+
 
 class TestCreditCard:
     """Tests for CreditCard dataclass."""
@@ -126,6 +157,35 @@ class TestCreditCard:
         assert categories["dining"] in card.categories
         assert card.categories[categories["dining"]].rate == 0.05
 
+    def test_credit_card_category_vectors(self):
+        """Test the per-category rate/cap vectors follow the categories order."""
+        card = CreditCard(
+            name="Test Card",
+            reference_link="http://test.com",
+            annual_fee=100,
+            categories={categories["grocery"]: CardCategory(rate=0.05, cap=100)},
+            base_rate=0.01,
+        )
+        keys = list(categories)
+        assert len(card.category_rates) == len(keys)
+        assert card.category_rates[keys.index("grocery")] == 0.05
+        assert card.category_caps[keys.index("grocery")] == 100
+        assert card.category_rates[keys.index("dining")] == 0.01
+        assert card.category_caps[keys.index("dining")] == float("inf")
+
+    def test_credit_card_finite_caps(self):
+        """Test that only capped categories are listed in finite_caps."""
+        card = CreditCard(
+            name="Test Card",
+            reference_link="http://test.com",
+            annual_fee=100,
+            categories={
+                categories["grocery"]: CardCategory(rate=0.05, cap=100),
+                categories["dining"]: CardCategory(rate=0.02),
+            },
+        )
+        assert card.finite_caps == ((categories["grocery"], 0.05, 100),)
+
     def test_credit_card_with_caps(self):
         """Test creating a CreditCard with caps."""
         card = CreditCard(
@@ -179,6 +239,12 @@ class TestCreditCard:
         assert len(card.tiers) == 1
         assert card.tiers[0].name == "Tier 1"
 
+    def test_credit_card_is_frozen(self):
+        """Test that CreditCard is immutable so cached cards can be shared."""
+        card = CreditCard(name="Test Card", reference_link="http://test.com", annual_fee=100)
+        with pytest.raises(Exception):  # FrozenInstanceError
+            card.annual_fee = 0
+
 
 class TestLifestylePlan:
     """Tests for LifestylePlan dataclass."""
@@ -192,6 +258,24 @@ class TestLifestylePlan:
         assert plan.name == "Plan 1"
         assert len(plan.categories_rate_cap) == 1
 
+    def test_lifestyle_plan_flat_rates(self):
+        """Test that plan rates are flattened across all groups."""
+        plan = LifestylePlan(
+            name="Plan 1",
+            categories_rate_cap=[
+                {categories["dining"]: CardCategory(rate=0.10, cap=250)},
+                {
+                    categories["grocery"]: CardCategory(rate=0.03, cap=250),
+                    categories["education"]: CardCategory(rate=0.03, cap=250),
+                },
+            ],
+        )
+        assert plan.rates == {
+            categories["dining"]: 0.10,
+            categories["grocery"]: 0.03,
+            categories["education"]: 0.03,
+        }
+
 
 class TestLifestyleCard:
     """Tests for LifestyleCard dataclass."""
@@ -213,6 +297,95 @@ class TestLifestyleCard:
         assert card.plans[0].name == "Plan 1"
         assert isinstance(card, CreditCard)  # LifestyleCard inherits from CreditCard
 
+    def test_lifestyle_card_has_no_instance_dict(self):
+        """Test LifestyleCard keeps the slotted layout of CreditCard."""
+        card = LifestyleCard(name="Lifestyle Card", reference_link="", annual_fee=0)
+        assert not hasattr(card, "__dict__")
+
+
+class TestSlottedLayout:
+    """Tests that model instances keep the slotted, dict-free layout."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Category(key="Test", display_name="Test"),
+            CardCategory(rate=0.05),
+            TierCategory(rate=0.05),
+            CashbackTier(
+                name="Tier 1",
+                min_spend=0,
+                max_spend=1000,
+                categories={},
+                base_rate=0.01,
+            ),
+            CreditCard(name="Test Card", reference_link="", annual_fee=0),
+            LifestylePlan(name="Plan 1", categories_rate_cap=[]),
+            OptimizationResult(
+                results_df=pd.DataFrame(), total_savings=0, chosen_plan=""
+            ),
+        ],
+        ids=lambda instance: type(instance).__name__,
+    )
+    def test_instance_has_no_dict(self, instance):
+        """Test the instance stores its fields in slots only."""
+        assert not hasattr(instance, "__dict__")
+
+
+class TestReadOnlyCards:
+    """Tests that shared card configurations cannot change after creation."""
+
+    def test_card_is_hashable(self):
+        """Test that equal cards with categories and tiers hash equally."""
+
+        def build():
+            return CreditCard(
+                name="Test Card",
+                reference_link="",
+                annual_fee=0,
+                categories={categories["dining"]: CardCategory(rate=0.05)},
+                tiers=[
+                    CashbackTier(
+                        name="Tier 1",
+                        min_spend=0,
+                        max_spend=float("inf"),
+                        categories={categories["dining"]: TierCategory(rate=0.05)},
+                        base_rate=0.01,
+                    )
+                ],
+            )
+
+        assert build() == build()
+        assert hash(build()) == hash(build())
+
+    def test_card_categories_are_read_only(self):
+        """Test that the categories cannot drift from the derived vectors."""
+        source = {categories["dining"]: CardCategory(rate=0.05)}
+        card = CreditCard(
+            name="Test Card", reference_link="", annual_fee=0, categories=source
+        )
+        source[categories["grocery"]] = CardCategory(rate=0.10)
+        with pytest.raises(TypeError):
+            card.categories[categories["grocery"]] = CardCategory(rate=0.10)  # type: ignore[index]
+        assert list(card.categories) == [categories["dining"]]
+        assert isinstance(card.tiers, tuple)
+
+    def test_lifestyle_plans_are_read_only(self):
+        """Test that a lifestyle card's plans and their groups are read-only."""
+        plan = LifestylePlan(
+            name="Plan 1",
+            categories_rate_cap=[{categories["dining"]: CardCategory(rate=0.10)}],
+        )
+        card = LifestyleCard(
+            name="Lifestyle", reference_link="", annual_fee=0, plans=[plan]
+        )
+        assert isinstance(card.plans, tuple)
+        with pytest.raises(TypeError):
+            plan.categories_rate_cap[0][categories["grocery"]] = CardCategory(rate=0.1)  # type: ignore[index]
+        with pytest.raises(TypeError):
+            plan.rates[categories["grocery"]] = 0.1  # type: ignore[index]
+        hash(card)
+
 
 class TestOptimizationResult:
     """Tests for OptimizationResult dataclass."""
@@ -245,32 +418,25 @@ class TestCategoriesConstant:
     def test_categories_exists(self):
         """Test that categories constant is defined."""
         assert categories is not None
-        assert isinstance(categories, dict)
-
-    def test_categories_has_expected_keys(self):
-        """Test that categories has expected keys."""
-        expected_keys = [
-            "dining",
-            "grocery",
-            "gas_station",
-            "pharmacy",
-            "travel_hotels",
-            "education",
-            "medical_care",
-            "online_shopping_local",
-            "international_spend",
-            "other_local_spend",
-        ]
-        for key in expected_keys:
-            assert key in categories
-
-    def test_categories_values_are_category_instances(self):
-        """Test that all values in categories are Category instances."""
-        for cat in categories.values():
-            assert isinstance(cat, Category)
-
-    def test_categories_have_display_names(self):
-        """Test that all categories have display names."""
-        for cat in categories.values():
-            assert cat.display_name
-            assert cat.key
+        assert isinstance(categories, Mapping)
+
+    def test_categories_is_read_only(self):
+        """Test that the shared categories mapping cannot be modified."""
+        with pytest.raises(TypeError):
+            categories["new"] = Category(key="New", display_name="New")  # type: ignore[index]
+
+    @pytest.mark.parametrize("key", _EXPECTED_CATEGORY_KEYS)
+    def test_categories_has_expected_key(self, key):
+        """Test that categories has the expected key."""
+        assert key in categories
+
+    @pytest.mark.parametrize("cat", list(categories.values()), ids=lambda c: c.key)
+    def test_category_is_category_instance(self, cat):
+        """Test that the categories value is a Category instance."""
+        assert isinstance(cat, Category)
+
+    @pytest.mark.parametrize("cat", list(categories.values()), ids=lambda c: c.key)
+    def test_category_has_display_name(self, cat):
+        """Test that the category has a key and a display name."""
+        assert cat.display_name
+        assert cat.key
@@ -1,12 +1,8 @@
-import math
-import pathlib
-import sys
-
 import pytest
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+pulp = pytest.importorskip("pulp")
 
-pandas = pytest.importorskip("pandas")
+pytestmark = pytest.mark.slow
 
 from models import (
     CardCategory,
@@ -17,175 +13,150 @@ from models import (
     TierCategory,
     categories,
 )
-from optimizer import solve_optimization
+import optimizer
+from optimizer import clear_solution_cache, solve_optimization
+
+
+@pytest.fixture(autouse=True)
+def _fresh_solution_cache():
+    """Start every test without cached results or warm starts from others."""
+    clear_solution_cache()
 
 
 def _monthly_spend(amounts):
     return {categories[key].key: value for key, value in amounts.items()}
 
 
-def _extract_card_spend(result_df, card_name):
+def _card_spend_totals(result_df):
+    """Return the total allocated spend per card name in one pass."""
     if result_df.empty:
-        return 0.0
-    return result_df[result_df["Card"] == card_name]["Amount"].sum()
-
-
-def test_dropping_fee_heavy_card_matches_removing_it():
-    flat_card = CreditCard(
-        name="FlatSaver",
-        reference_link="",
-        annual_fee=0.0,
-        base_rate=0.02,
-    )
-    fee_card = CreditCard(
-        name="FeeTrap",
-        reference_link="",
-        annual_fee=500.0,
-        base_rate=0.02,
-    )
-    monthly_spend = _monthly_spend({"other_local_spend": 2000.0})
+        return {}
+    return result_df.groupby("Card", sort=False)["Amount"].sum().to_dict()
 
-    with_fee_result = solve_optimization([flat_card, fee_card], monthly_spend)
-    without_fee_result = solve_optimization([flat_card], monthly_spend)
 
-    assert with_fee_result is not None
-    assert without_fee_result is not None
+# Cards are frozen, so module-level instances are shared safely by tests.
+# A fee-free 1% card that the other cards are measured against.
+_BASELINE_CARD = CreditCard(
+    name="Baseline", reference_link="", annual_fee=0.0, base_rate=0.01
+)
 
-    assert math.isclose(
-        with_fee_result.total_savings,
-        without_fee_result.total_savings,
-        rel_tol=1e-7,
-        abs_tol=1e-6,
-    )
-    # Ensure the optimizer did not allocate spend to the fee-heavy card.
-    assert _extract_card_spend(with_fee_result.results_df, "FeeTrap") == pytest.approx(0.0)
+# Pays 5% on dining, but only once the card sees 500 a month.
+_TIERED_THRESHOLD_CARD = CreditCard(
+    name="TieredThreshold",
+    reference_link="",
+    annual_fee=0.0,
+    base_rate=0.0,
+    min_spend_for_cashback=500.0,
+    tiers=[
+        CashbackTier(
+            name="FlatBonus",
+            min_spend=0.0,
+            max_spend=float("inf"),
+            categories={
+                categories["dining"]: TierCategory(rate=0.05),
+            },
+            base_rate=0.0,
+        )
+    ],
+)
 
 
-def test_tiered_card_cannot_earn_without_activation():
-    baseline_card = CreditCard(
-        name="Baseline",
-        reference_link="",
-        annual_fee=0.0,
-        base_rate=0.02,
-    )
-    tiered_card = CreditCard(
-        name="TieredWindfall",
-        reference_link="",
-        annual_fee=500.0,
-        base_rate=0.01,
-        tiers=[
-            CashbackTier(
-                name="Bonus",
-                min_spend=0.0,
-                max_spend=float("inf"),
+@pytest.mark.parametrize(
+    "baseline_card, dominated_card, amounts",
+    [
+        pytest.param(
+            CreditCard(
+                name="FlatSaver", reference_link="", annual_fee=0.0, base_rate=0.02
+            ),
+            CreditCard(
+                name="FeeTrap", reference_link="", annual_fee=500.0, base_rate=0.02
+            ),
+            {"other_local_spend": 2000.0},
+            id="same-rate-with-fee",
+        ),
+        pytest.param(
+            CreditCard(
+                name="Baseline", reference_link="", annual_fee=0.0, base_rate=0.02
+            ),
+            CreditCard(
+                name="TieredWindfall",
+                reference_link="",
+                annual_fee=500.0,
+                base_rate=0.01,
+                tiers=[
+                    CashbackTier(
+                        name="Bonus",
+                        min_spend=0.0,
+                        max_spend=float("inf"),
+                        categories={
+                            categories["dining"]: TierCategory(rate=0.05),
+                        },
+                        base_rate=0.01,
+                    )
+                ],
+            ),
+            {"dining": 800.0},
+            id="tier-bonus-below-fee",
+        ),
+        pytest.param(
+            _BASELINE_CARD,
+            _TIERED_THRESHOLD_CARD,
+            {"dining": 300.0},
+            id="tier-minimum-unmet",
+        ),
+        pytest.param(
+            _BASELINE_CARD,
+            CreditCard(
+                name="BonusDining",
+                reference_link="",
+                annual_fee=0.0,
+                base_rate=0.0,
+                min_spend_for_cashback=500.0,
                 categories={
-                    categories["dining"]: TierCategory(rate=0.05),
+                    categories["dining"]: CardCategory(rate=0.05),
                 },
-                base_rate=0.01,
-            )
-        ],
-    )
-
-    monthly_spend = _monthly_spend({"dining": 800.0})
-
-    result = solve_optimization([baseline_card, tiered_card], monthly_spend)
-    assert result is not None
-
-    tiered_spend = _extract_card_spend(result.results_df, "TieredWindfall")
-    baseline_spend = _extract_card_spend(result.results_df, "Baseline")
+            ),
+            {"dining": 300.0},
+            id="minimum-unmet",
+        ),
+    ],
+)
+def test_dominated_card_is_left_unused(baseline_card, dominated_card, amounts):
+    """Test that a card that cannot beat the baseline gets no spend.
 
-    assert tiered_spend == pytest.approx(0.0)
-    assert baseline_spend == pytest.approx(800.0)
+    Adding it must not change the savings of the baseline card alone.
+    """
+    monthly_spend = _monthly_spend(amounts)
 
+    result = solve_optimization([baseline_card, dominated_card], monthly_spend)
     baseline_only = solve_optimization([baseline_card], monthly_spend)
+    assert result is not None
     assert baseline_only is not None
-    assert result.total_savings == pytest.approx(baseline_only.total_savings)
-
 
-def test_tiered_card_respects_minimum_spend_requirement():
-    baseline_card = CreditCard(
-        name="Baseline", reference_link="", annual_fee=0.0, base_rate=0.01
-    )
-    tiered_card = CreditCard(
-        name="TieredThreshold",
-        reference_link="",
-        annual_fee=0.0,
-        base_rate=0.0,
-        min_spend_for_cashback=500.0,
-        tiers=[
-            CashbackTier(
-                name="FlatBonus",
-                min_spend=0.0,
-                max_spend=float("inf"),
-                categories={
-                    categories["dining"]: TierCategory(rate=0.05),
-                },
-                base_rate=0.0,
-            )
-        ],
+    totals = _card_spend_totals(result.results_df)
+    assert totals.get(dominated_card.name, 0.0) == pytest.approx(0.0)
+    assert totals.get(baseline_card.name, 0.0) == pytest.approx(sum(amounts.values()))
+    assert result.total_savings == pytest.approx(
+        baseline_only.total_savings, rel=1e-7, abs=1e-6
     )
 
-    low_spend = _monthly_spend({"dining": 300.0})
-    low_result = solve_optimization([baseline_card, tiered_card], low_spend)
-
-    assert low_result is not None
-    assert _extract_card_spend(low_result.results_df, "TieredThreshold") == pytest.approx(0.0)
-    assert _extract_card_spend(low_result.results_df, "Baseline") == pytest.approx(300.0)
-
-    baseline_only_low = solve_optimization([baseline_card], low_spend)
-    assert baseline_only_low is not None
-    assert low_result.total_savings == pytest.approx(baseline_only_low.total_savings)
 
+def test_tiered_card_pays_once_minimum_spend_is_met():
+    """Test that the tiered card takes all spend once its minimum is reached."""
     qualifying_spend = _monthly_spend({"dining": 600.0})
     qualifying_result = solve_optimization(
-        [baseline_card, tiered_card], qualifying_spend
+        [_BASELINE_CARD, _TIERED_THRESHOLD_CARD], qualifying_spend
     )
 
     assert qualifying_result is not None
-    assert _extract_card_spend(
-        qualifying_result.results_df, "TieredThreshold"
-    ) == pytest.approx(600.0)
-    assert _extract_card_spend(
-        qualifying_result.results_df, "Baseline"
-    ) == pytest.approx(0.0)
+    totals = _card_spend_totals(qualifying_result.results_df)
+    assert totals.get("TieredThreshold", 0.0) == pytest.approx(600.0)
+    assert totals.get("Baseline", 0.0) == pytest.approx(0.0)
 
     expected_savings = 600.0 * 0.05 * 12
     assert qualifying_result.total_savings == pytest.approx(expected_savings)
 
 
-def test_minimum_spend_card_gets_deactivated_when_requirement_unmet():
-    baseline_card = CreditCard(
-        name="Baseline",
-        reference_link="",
-        annual_fee=0.0,
-        base_rate=0.01,
-    )
-    bonus_card = CreditCard(
-        name="BonusDining",
-        reference_link="",
-        annual_fee=0.0,
-        base_rate=0.0,
-        min_spend_for_cashback=500.0,
-        categories={
-            categories["dining"]: CardCategory(rate=0.05),
-        },
-    )
-    monthly_spend = _monthly_spend({"dining": 300.0})
-
-    result = solve_optimization([baseline_card, bonus_card], monthly_spend)
-    assert result is not None
-
-    # All dining spend should fall back to the baseline card because the bonus card
-    # cannot meet its minimum spend requirement.
-    assert _extract_card_spend(result.results_df, "BonusDining") == pytest.approx(0.0)
-    assert _extract_card_spend(result.results_df, "Baseline") == pytest.approx(300.0)
-
-    # The bonus card should not improve the total savings compared to using only the baseline card.
-    baseline_only = solve_optimization([baseline_card], monthly_spend)
-    assert baseline_only is not None
-    assert result.total_savings == pytest.approx(baseline_only.total_savings)
-
-
 def test_tiered_cashback_activates_correct_tier():
     """Test that tiered cashback cards correctly activate the appropriate tier."""
     from models import CashbackTier, TierCategory
@@ -278,3 +249,259 @@ def test_tiered_cashback_respects_category_caps():
     # Annual savings: 87 * 12 = 1044 SAR
     expected_savings = (50 + 30 + 5 + 2) * 12
     assert result.total_savings == pytest.approx(expected_savings, abs=1e-6)
+
+
+def test_lifestyle_card_picks_the_best_plan():
+    """Test that the Lifestyle bonus follows the single chosen plan."""
+    lifestyle_card = LifestyleCard(
+        name="Lifestyle",
+        reference_link="",
+        annual_fee=0.0,
+        base_rate=0.01,
+        plans=[
+            LifestylePlan(
+                name="Dining Plan",
+                categories_rate_cap=[
+                    {categories["dining"]: CardCategory(rate=0.10, cap=50)}
+                ],
+            ),
+            LifestylePlan(
+                name="Grocery Plan",
+                categories_rate_cap=[
+                    {categories["grocery"]: CardCategory(rate=0.10, cap=50)}
+                ],
+            ),
+        ],
+    )
+    monthly_spend = _monthly_spend({"dining": 400.0, "grocery": 200.0})
+
+    result = solve_optimization([lifestyle_card], monthly_spend)
+    assert result is not None
+    assert result.chosen_plan == "Dining Plan"
+
+    # Base 1% on everything plus the 9% dining bonus: 6 + 36 = 42 per month.
+    assert result.total_savings == pytest.approx(42.0 * 12)
+
+
+def test_unspent_categories_get_no_allocation():
+    """Test that categories left at zero never show up in the results."""
+    card = CreditCard(
+        name="Flat",
+        reference_link="",
+        annual_fee=0.0,
+        base_rate=0.01,
+    )
+    monthly_spend = _monthly_spend({"dining": 300.0, "grocery": 0.0})
+
+    result = solve_optimization([card], monthly_spend)
+    assert result is not None
+    assert set(result.results_df["Category"]) == {categories["dining"].key}
+    assert result.total_savings == pytest.approx(3.0 * 12)
+
+
+def test_warm_start_reaches_the_same_savings():
+    """Test that seeding the solver with a previous solution changes nothing."""
+    card = CreditCard(
+        name="Grocer",
+        reference_link="",
+        annual_fee=0.0,
+        base_rate=0.01,
+        categories={categories["grocery"]: CardCategory(rate=0.05, cap=20)},
+    )
+    other = CreditCard(name="Flat", reference_link="", annual_fee=0.0, base_rate=0.02)
+    first = solve_optimization(
+        [card, other], _monthly_spend({"grocery": 600.0, "dining": 200.0})
+    )
+    assert first is not None
+    assert first.variable_values
+
+    # Forget first's result and warm start so this solve starts cold.
+    clear_solution_cache()
+    cold = solve_optimization(
+        [card, other], _monthly_spend({"grocery": 650.0, "dining": 200.0})
+    )
+    # An explicit solver bypasses the solution cache, so this really re-solves.
+    warm = solve_optimization(
+        [card, other],
+        _monthly_spend({"grocery": 650.0, "dining": 200.0}),
+        first.variable_values,
+        solver=pulp.PULP_CBC_CMD(msg=False, warmStart=True),
+    )
+    assert cold is not None and warm is not None
+    assert warm.total_savings == pytest.approx(cold.total_savings)
+
+
+def test_capped_spend_overflows_to_next_best_card():
+    """Test that spend beyond a category cap moves to the next best card."""
+    capped = CreditCard(
+        name="Capped",
+        reference_link="",
+        annual_fee=0.0,
+        categories={categories["grocery"]: CardCategory(rate=0.05, cap=20)},
+    )
+    flat = CreditCard(name="Flat", reference_link="", annual_fee=0.0, base_rate=0.02)
+
+    result = solve_optimization([capped, flat], _monthly_spend({"grocery": 1000.0}))
+    assert result is not None
+    totals = _card_spend_totals(result.results_df)
+    assert totals.get("Capped", 0.0) == pytest.approx(400.0)
+    assert totals.get("Flat", 0.0) == pytest.approx(600.0)
+    # 5% on the first 400 (capped at 20) plus 2% on the remaining 600.
+    assert result.total_savings == pytest.approx(32.0 * 12)
+
+
+def test_explicit_solver_is_used():
+    """Test that a caller-supplied PuLP solver replaces the default one."""
+    card = CreditCard(name="Flat", reference_link="", annual_fee=0.0, base_rate=0.01)
+
+    result = solve_optimization(
+        [card],
+        _monthly_spend({"dining": 100.0}),
+        solver=pulp.PULP_CBC_CMD(msg=False),
+    )
+    assert result is not None
+    assert result.total_savings == pytest.approx(12.0)
+
+
+def test_repeated_problem_is_served_from_cache(monkeypatch):
+    """Test that identical problems reuse the result without re-solving."""
+    solves = []
+    solve_milp = optimizer._solve_milp
+
+    def counting_solve_milp(*args, **kwargs):
+        solves.append(args)
+        return solve_milp(*args, **kwargs)
+
+    monkeypatch.setattr(optimizer, "_solve_milp", counting_solve_milp)
+    # The tiered card keeps the problem off the analytical shortcut, and the
+    # cleared cache makes the first solve start from the greedy seed.
+    cards = [_BASELINE_CARD, _TIERED_THRESHOLD_CARD]
+    spend = _monthly_spend({"dining": 600.0})
+
+    first = solve_optimization(cards, spend)
+    second = solve_optimization(cards, spend)
+    assert first is not None and second is not None
+    assert len(solves) == 1
+    assert second.total_savings == pytest.approx(first.total_savings)
+    assert second.results_df is not first.results_df
+
+    # Same name, different rate: must not be answered from the cache.
+    richer = CreditCard(
+        name="Baseline", reference_link="", annual_fee=0.0, base_rate=0.06
+    )
+    third = solve_optimization([richer, _TIERED_THRESHOLD_CARD], spend)
+    assert third is not None
+    assert len(solves) == 2
+    assert third.total_savings == pytest.approx(600.0 * 0.06 * 12)
+
+
+def test_uncapped_plain_cards_match_the_solver():
+    """Test that the no-solver shortcut agrees with an explicit MILP solve."""
+    dining = CreditCard(
+        name="Dining",
+        reference_link="",
+        annual_fee=0.0,
+        base_rate=0.01,
+        categories={categories["dining"]: CardCategory(rate=0.05)},
+    )
+    flat = CreditCard(name="Flat", reference_link="", annual_fee=0.0, base_rate=0.015)
+    spend = _monthly_spend({"dining": 1000.0, "grocery": 400.0})
+
+    shortcut = solve_optimization([dining, flat], spend)
+    solved = solve_optimization(
+        [dining, flat], spend, solver=pulp.PULP_CBC_CMD(msg=False)
+    )
+    assert shortcut is not None and solved is not None
+    assert shortcut.total_savings == pytest.approx(solved.total_savings)
+    totals = _card_spend_totals(shortcut.results_df)
+    assert totals.get("Dining", 0.0) == pytest.approx(1000.0)
+    assert totals.get("Flat", 0.0) == pytest.approx(400.0)
+
+
+def test_poor_warm_start_still_reaches_the_optimum():
+    """Test that a feasible but suboptimal MIP start is not returned as optimal."""
+    fee_card = CreditCard(
+        name="FeeCard",
+        reference_link="",
+        annual_fee=0.0,
+        annual_fee_if_condition_not_met=100.0,
+        minimum_annual_spend_for_fee_waiver=12000.0,
+        base_rate=0.01,
+    )
+    free = CreditCard(name="Free", reference_link="", annual_fee=0.0, base_rate=0.005)
+    poor_start = {
+        "CardActive_FeeCard": 1,
+        "CardActive_Free": 0,
+        "FeeWaived_FeeCard": 0,
+        "Spend_('FeeCard',_'Dining')": 500.0,
+        "Spend_('Free',_'Dining')": 0.0,
+    }
+
+    result = solve_optimization(
+        [fee_card, free],
+        _monthly_spend({"dining": 500.0}),
+        initial_values=poor_start,
+        solver=pulp.PULP_CBC_CMD(msg=False, warmStart=True),
+    )
+    assert result is not None
+    # 2.5 a month on the free card beats 5 a month minus the 100 annual fee.
+    assert result.total_savings == pytest.approx(2.5 * 12)
+
+
+def test_fee_is_waived_only_above_the_spend_threshold():
+    """Test that the conditional fee applies until annual spend reaches the waiver."""
+    card = CreditCard(
+        name="Waiver",
+        reference_link="",
+        annual_fee=0.0,
+        annual_fee_if_condition_not_met=100.0,
+        minimum_annual_spend_for_fee_waiver=12000.0,
+        base_rate=0.01,
+    )
+    waived = solve_optimization([card], _monthly_spend({"dining": 1500.0}))
+    assert waived is not None
+    assert waived.total_savings == pytest.approx(15.0 * 12)
+
+    # Below the threshold 60 a year minus the 100 fee loses to a free 0.5% card.
+    free = CreditCard(name="Free", reference_link="", annual_fee=0.0, base_rate=0.005)
+    not_waived = solve_optimization(
+        [card, free], _monthly_spend({"dining": 500.0})
+    )
+    assert not_waived is not None
+    assert not_waived.total_savings == pytest.approx(2.5 * 12)
+    totals = _card_spend_totals(not_waived.results_df)
+    assert totals.get("Waiver", 0.0) == pytest.approx(0.0)
+
+
+def test_solver_limits_can_be_tightened():
+    """Test that an exact gap and a custom time limit give the same optimum."""
+    card = CreditCard(
+        name="MinSpend",
+        reference_link="",
+        annual_fee=0.0,
+        base_rate=0.02,
+        min_spend_for_cashback=500.0,
+    )
+    spend = _monthly_spend({"dining": 1000.0})
+
+    default = solve_optimization([card], spend)
+    exact = solve_optimization([card], spend, gap_rel=0.0, time_limit=30)
+    assert default is not None and exact is not None
+    assert exact.total_savings == pytest.approx(default.total_savings)
+    assert exact.total_savings == pytest.approx(20.0 * 12)
+
+
+def test_backends_without_mip_start_are_not_seeded(monkeypatch):
+    """Test that no start is built for a backend that would ignore it."""
+    seeds = []
+    monkeypatch.setattr(optimizer, "_NO_WARM_START", frozenset({"PULP_CBC_CMD"}))
+    monkeypatch.setattr(optimizer, "_seed_start", lambda *args: seeds.append(args))
+
+    result = solve_optimization(
+        [_BASELINE_CARD, _TIERED_THRESHOLD_CARD],
+        _monthly_spend({"dining": 600.0}),
+        solver=pulp.PULP_CBC_CMD(msg=False),
+    )
+    assert result is not None
+    assert not seeds
+    assert result.total_savings == pytest.approx(600.0 * 0.05 * 12)
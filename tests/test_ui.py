@@ -1,12 +1,8 @@
 """Tests for ui.py helper functions."""
 
-import pathlib
-import sys
-
 import pytest
 import pandas as pd
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 from models import (
     CardCategory,
     CreditCard,
@@ -50,6 +46,13 @@ class TestTranslatePlanName:
         result = translate_plan_name(plan_name, TRANSLATIONS["en"])
         assert result == plan_name
 
+    def test_translate_plan_name_with_custom_table(self):
+        """Test that a table outside TRANSLATIONS is used as given."""
+        plan_name = "10% on Dining"
+        for word in ("at", "for"):
+            result = translate_plan_name(plan_name, {"plan_on": word, "Dining": "D"})
+            assert result == f"**10%** {word} D"
+
 
 class TestGetSpendingDetails:
     """Tests for _get_spending_details function."""
@@ -144,6 +147,23 @@ class TestGetSpendingDetails:
         result = _get_spending_details(results_df, [card_a, card_b], "")
         assert len(result) == 2
 
+    def test_get_spending_details_skips_unknown_rows(self):
+        """Test that rows for unknown cards or categories are dropped."""
+        results_df = pd.DataFrame(
+            {
+                "Card": ["Card A", "Missing", "Card A"],
+                "Category": ["Dining", "Dining", "Not A Category"],
+                "Amount": [100.0, 200.0, 300.0],
+            }
+        )
+        card = CreditCard(
+            name="Card A", reference_link="http://test.com", annual_fee=0, base_rate=0.02
+        )
+        result = _get_spending_details(results_df, [card], "")
+        assert result.to_dict("records") == [
+            {"Category": "Dining", "Card": "Card A", "Amount": 100.0, "Rate": 0.02}
+        ]
+
 
 class TestGeneratePriorityGuide:
     """Tests for generate_priority_guide function."""
@@ -204,6 +224,34 @@ class TestGeneratePriorityGuide:
         assert "Card A" in result
         assert "Card B" in result
 
+    def test_generate_priority_guide_orders_by_rate(self):
+        """Test that cards are listed from highest to lowest rate."""
+        results_df = pd.DataFrame(
+            {
+                "Card": ["Card B", "Card A"],
+                "Category": ["Dining", "Dining"],
+                "Amount": [200.0, 100.0],
+            }
+        )
+        card_a = CreditCard(
+            name="Card A",
+            reference_link="http://test.com",
+            annual_fee=0,
+            base_rate=0.02,
+            categories={categories["dining"]: CardCategory(rate=0.05)},
+        )
+        card_b = CreditCard(
+            name="Card B",
+            reference_link="http://test.com",
+            annual_fee=0,
+            base_rate=0.02,
+            categories={categories["dining"]: CardCategory(rate=0.03)},
+        )
+        result = generate_priority_guide(
+            results_df, [card_a, card_b], "", TRANSLATIONS["en"]
+        )
+        assert result.index("1. Use **Card A**") < result.index("2. Use **Card B**")
+
     def test_generate_priority_guide_arabic(self):
         """Test generate_priority_guide with Arabic translations."""
         results_df = pd.DataFrame(
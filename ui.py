@@ -3,14 +3,20 @@ This module handles the user interface components of the Streamlit application,
 including the sidebar setup, results display, and chart generation.
 """
 
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from typing import Dict, List, Tuple
 
-import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
 from models import CreditCard, LifestyleCard, OptimizationResult, categories
+from translations import TRANSLATIONS
+
+# Category lookup by key, shared by every results view.
+_CATEGORY_BY_KEY = {cat.key: cat for cat in categories.values()}
 
 
 def _setup_spending_inputs(t: dict, currency_symbol: str) -> Dict[str, int]:
@@ -75,6 +81,22 @@ def setup_sidebar(
 
 def translate_plan_name(plan_name: str, t: dict) -> str:
     """Parses and translates a detailed plan name."""
+    # The app only passes the shared TRANSLATIONS tables, so those results
+    # can be cached per language; any other dict is translated directly.
+    for lang, table in TRANSLATIONS.items():
+        if table is t:
+            return _translate_plan_name_cached(plan_name, lang)
+    return _translate_plan_name(plan_name, t)
+
+
+@lru_cache(maxsize=256)
+def _translate_plan_name_cached(plan_name: str, lang: str) -> str:
+    """Memoized translate_plan_name for one of the TRANSLATIONS tables."""
+    return _translate_plan_name(plan_name, TRANSLATIONS[lang])
+
+
+def _translate_plan_name(plan_name: str, t: dict) -> str:
+    """Uncached translate_plan_name."""
     if not plan_name:
         return ""
     try:
@@ -93,7 +115,7 @@ def _get_spending_details(
     results_df: pd.DataFrame, cards: List[CreditCard], chosen_plan_name: str
 ) -> pd.DataFrame:
     """Calculates effective rates and returns a detailed spending DataFrame."""
-    category_map = {cat.key: cat for cat in categories.values()}
+    card_by_name = {c.name: c for c in cards}
     lifestyle_card = next((c for c in cards if isinstance(c, LifestyleCard)), None)
     chosen_plan = (
         next((p for p in lifestyle_card.plans if p.name == chosen_plan_name), None)
@@ -101,37 +123,29 @@ def _get_spending_details(
         else None
     )
 
-    details = []
-    for i in range(len(results_df)):
-        card_name = str(results_df.iloc[i]["Card"])
-        category_key = str(results_df.iloc[i]["Category"])
-        amount = float(results_df.iloc[i]["Amount"])
-
-        card = next((c for c in cards if c.name == card_name), None)
-        cat = category_map.get(category_key)
+    if results_df.empty:
+        return pd.DataFrame()
+
+    columns = {"Category": [], "Card": [], "Amount": [], "Rate": []}
+    for card_name, category_key, amount in zip(
+        results_df["Card"], results_df["Category"], results_df["Amount"]
+    ):
+        card = card_by_name.get(str(card_name))
+        cat = _CATEGORY_BY_KEY.get(str(category_key))
         if not (card and cat):
             continue
 
-        rate = 0.0
-        if card:
-            rate = card.base_rate
-            if card == lifestyle_card and chosen_plan:
-                for group in chosen_plan.categories_rate_cap:
-                    if cat in group:
-                        rate = group[cat].rate
-                        break
-            elif cat in card.categories:
-                rate = card.categories[cat].rate
-
-        details.append(
-            {
-                "Category": cat.key,
-                "Card": card.name,
-                "Amount": amount,
-                "Rate": rate,
-            }
-        )
-    return pd.DataFrame(details)
+        rate = card.base_rate
+        if card == lifestyle_card and chosen_plan:
+            rate = chosen_plan.rates.get(cat, rate)
+        elif cat in card.categories:
+            rate = card.categories[cat].rate
+
+        columns["Category"].append(cat.key)
+        columns["Card"].append(card.name)
+        columns["Amount"].append(float(amount))
+        columns["Rate"].append(rate)
+    return pd.DataFrame(columns)
 
 
 def generate_priority_guide(
@@ -141,30 +155,37 @@ def generate_priority_guide(
     if results_df.empty:
         return ""
 
-    df_details = _get_spending_details(results_df, cards, chosen_plan_name)
+    return _priority_guide_from_details(
+        _get_spending_details(results_df, cards, chosen_plan_name), t
+    )
+
+
+def _priority_guide_from_details(df_details: pd.DataFrame, t: dict) -> str:
+    """Builds the priority guide from an already computed details DataFrame."""
     if df_details.empty:
         return t["priority_none_needed"]
 
     guide = [f"### {t['priority_header']}", t["priority_description"]]
     has_priorities = False
     currency = t["currency_symbol"]
-    cat_map = {cat.key: cat for cat in categories.values()}
 
-    for cat_key, group in df_details.groupby("Category"):
+    # A handful of rows: sorting tuples is cheaper than a DataFrame groupby.
+    rows = sorted(
+        df_details.itertuples(index=False), key=lambda r: (r.Category, -r.Rate)
+    )
+    for cat_key, group_iter in groupby(rows, key=attrgetter("Category")):
+        group = list(group_iter)
         if len(group) > 1:
             has_priorities = True
             cat_key_str = str(cat_key)
-            if cat_key_str in cat_map:
-                display_name = t.get(cat_map[cat_key_str].display_name, cat_key_str)
-            else:
-                display_name = cat_key_str
+            cat = _CATEGORY_BY_KEY.get(cat_key_str)
+            display_name = t.get(cat.display_name, cat_key_str) if cat else cat_key_str
             guide.append(f"- **{display_name}:**")
-            sorted_group = pd.DataFrame(group).sort_values("Rate", ascending=False)
-            for i, (_, row) in enumerate(sorted_group.iterrows()):
+            for i, row in enumerate(group):
                 guide.append(
-                    f"  {i + 1}. {t['priority_use']} **{row['Card']}** "
-                    f"({t['priority_at']} {row['Rate']:.1%}) "
-                    f"{t['priority_for_first']} **{currency} {row['Amount']:,.2f}**."
+                    f"  {i + 1}. {t['priority_use']} **{row.Card}** "
+                    f"({t['priority_at']} {row.Rate:.1%}) "
+                    f"{t['priority_for_first']} **{currency} {row.Amount:,.2f}**."
                 )
             guide.append("")
 
@@ -179,16 +200,17 @@ def display_charts(results_df: pd.DataFrame, t: dict, currency_symbol: str):
     st.markdown(f"### {t.get('charts_header', 'Visual Insights')}")
 
     results_df["Monthly Cashback"] = results_df["Amount"] * results_df["Rate"]
-    monthly_spending = results_df.groupby("Card")["Amount"].sum()
-    monthly_cashback = results_df.groupby("Card")["Monthly Cashback"].sum()
+    monthly = results_df.groupby("Card")[["Amount", "Monthly Cashback"]].sum()
+    monthly_spending = monthly["Amount"].to_numpy()
+    monthly_cashback = monthly["Monthly Cashback"].to_numpy()
 
     chart_data = pd.DataFrame(
         {
-            "Card": monthly_spending.index,
-            "Monthly Spending": monthly_spending.values,
-            "Monthly Cashback": monthly_cashback.values,
-            "Yearly Spending": np.array(monthly_spending.values) * 12,
-            "Yearly Cashback": np.array(monthly_cashback.values) * 12,
+            "Card": monthly.index,
+            "Monthly Spending": monthly_spending,
+            "Monthly Cashback": monthly_cashback,
+            "Yearly Spending": monthly_spending * 12,
+            "Yearly Cashback": monthly_cashback * 12,
         }
     )
 
@@ -278,17 +300,17 @@ def _display_results_header(total_savings, chosen_plan, t, currency_symbol):
 def _display_allocation_table(results_df, cards, t, currency_symbol):
     """Displays the spending allocation pivot table."""
     st.markdown(f"#### {t.get('allocation_header', 'Spending Allocation')}")
-    category_map = {cat.key: cat for cat in categories.values()}
     df = results_df.copy()
     df["Category"] = df["Category"].apply(
-        lambda k: t.get(category_map[k].display_name, k)
+        lambda k: t.get(_CATEGORY_BY_KEY[k].display_name, k)
+    )
+    # Each (category, card) pair appears once, so a plain unstack reshapes it.
+    pivot = (
+        df.set_index(["Category", "Card"])["Amount"]
+        .unstack("Card")
+        .map(lambda x: f"{currency_symbol} {x:,.2f}", na_action="ignore")
+        .fillna(" - ")
     )
-    amount_col = f"{t.get('amount_col', 'Amount')} ({currency_symbol})"
-    df[amount_col] = df["Amount"].apply(lambda x: f"{currency_symbol} {x:,.2f}")
-
-    pivot = df.pivot_table(
-        index="Category", columns="Card", values=amount_col, aggfunc="first"
-    ).fillna(" - ")
 
     card_links = {c.name: c.reference_link for c in cards}
     pivot.columns = pd.Index(
@@ -304,10 +326,9 @@ def _display_allocation_table(results_df, cards, t, currency_symbol):
 def _display_savings_breakdown(results_df, t, currency_symbol):
     """Displays the savings breakdown table."""
     st.markdown(f"#### {t.get('savings_breakdown_header', 'Savings Breakdown')}")
-    category_map = {cat.key: cat for cat in categories.values()}
     df = results_df.copy()
     df["Category"] = df["Category"].apply(
-        lambda k: t.get(category_map[k].display_name, k)
+        lambda k: t.get(_CATEGORY_BY_KEY[k].display_name, k)
     )
     df["Savings"] = df["Amount"] * df["Rate"]
     savings_per_cat = df.groupby("Category")["Savings"].sum().reset_index()
@@ -345,8 +366,6 @@ def display_results(
     display_charts(detailed_df, t, currency_symbol)
 
     st.markdown("---")
-    priority_guide = generate_priority_guide(
-        result.results_df, cards, result.chosen_plan, t
-    )
+    priority_guide = _priority_guide_from_details(detailed_df, t)
     st.markdown(priority_guide)
     st.balloons()